@@ -2,7 +2,7 @@
 Example: File Upload
 
 This example demonstrates how to upload files to Siray storage using the SDK.
-Files larger than 8MB are automatically uploaded using multipart upload.
+Files larger than 64MB are automatically uploaded using multipart upload.
 """
 
 from siray import Siray
@@ -34,10 +34,10 @@ def main():
         print(f"✗ Upload failed: {e}")
 
     # Example 2: Upload large file (multipart upload will be used automatically)
-    print("\n2. Upload large file (>8MB)")
+    print("\n2. Upload large file (>64MB)")
     print("-" * 60)
-    print("  For files larger than 8MB, the SDK automatically uses")
-    print("  multipart upload with 8MB chunks for better performance.")
+    print("  For files larger than 64MB, the SDK automatically uses")
+    print("  multipart upload with 32MB chunks for better performance.")
 
     large_file_path = "path/to/large/video.mp4"
 
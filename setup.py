@@ -29,14 +29,19 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=[
-        "httpx>=0.24.0",
+        "httpx[http2]>=0.24.0",
         "requests>=2.28.0",  # Fallback if httpx not available
         "boto3>=1.26.0",
+        "pybase64>=1.3",
     ],
     extras_require={
+        "speedups": [
+            "orjson>=3.6.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0",
@@ -5,6 +5,7 @@ A Python client library for the Siray AI API.
 """
 
 from .client import Siray
+from .async_client import AsyncSiray
 from .exceptions import (
     SirayError,
     AuthenticationError,
@@ -21,6 +22,7 @@ __version__ = "0.3.0"
 
 __all__ = [
     "Siray",
+    "AsyncSiray",
     "SirayError",
     "AuthenticationError",
     "BadRequestError",
@@ -0,0 +1,22 @@
+"""MIME type detection shared by data URIs and file uploads."""
+
+import functools
+import mimetypes
+from typing import Optional
+
+# Common media types, resolved without touching the system mimetypes database
+_EXT_MIME = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+    ".mp4": "video/mp4",
+    ".mov": "video/quicktime",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _guess_content_type(suffix: str) -> Optional[str]:
+    """Return the MIME type for a lowercased file suffix such as ``".png"``."""
+    return _EXT_MIME.get(suffix) or mimetypes.guess_type("file" + suffix)[0]
@@ -0,0 +1,130 @@
+"""Async Siray SDK client."""
+
+import os
+from typing import Optional, Union
+
+from .base_client import AsyncBaseClient
+from .resources.file import AsyncFile
+from .resources.image import AsyncImage
+from .resources.video import AsyncVideo
+
+
+class AsyncSiray:
+    """
+    Async client for interacting with Siray AI API.
+
+    Mirrors :class:`~siray.Siray`, but every network call is a coroutine
+    backed by a pooled ``httpx.AsyncClient``. This makes it cheap to start
+    and poll many tasks concurrently from a single thread.
+
+    Attributes:
+        file: File upload namespace
+        image: Image generation namespace
+        video: Video generation namespace
+
+    Example:
+        >>> import asyncio
+        >>> from siray import AsyncSiray
+        >>>
+        >>> async def main():
+        ...     async with AsyncSiray(api_key="your-api-key") as client:
+        ...         return await asyncio.gather(
+        ...             client.image.run(model="your-image-model", prompt="A red fox"),
+        ...             client.image.run(model="your-image-model", prompt="A blue whale"),
+        ...         )
+        >>>
+        >>> statuses = asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = "https://api.siray.ai",
+        gateway_url: str = "https://api-gateway.siray.ai",
+        timeout: int = 120,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        upload_verify: Optional[Union[bool, str]] = None,
+    ):
+        """
+        Initialize the async Siray client.
+
+        Args:
+            api_key: API key for authentication. If not provided, will look for
+                    SIRAY_API_KEY environment variable.
+            base_url: Base URL for the API (default: https://api.siray.ai)
+            gateway_url: Gateway URL for STS token (default: https://api-gateway.siray.ai)
+            timeout: Request timeout in seconds (default: 120)
+            max_connections: Maximum concurrent connections per host pool (default: 100)
+            max_keepalive_connections: Maximum idle connections kept open for
+                reuse per host pool (default: 20). Lower it for mostly idle
+                clients; raise it for heavy concurrent fan-out.
+            upload_verify: Optional TLS verification for file uploads: a CA
+                bundle path, or False to disable certificate checks (default:
+                verify with the system/botocore CA bundle)
+
+        Raises:
+            ValueError: If no API key is provided or found in environment
+            ImportError: If httpx is not installed
+        """
+        if api_key is None:
+            api_key = os.environ.get("SIRAY_API_KEY")
+
+        if not api_key:
+            raise ValueError(
+                "API key must be provided either as argument or "
+                "through SIRAY_API_KEY environment variable"
+            )
+
+        self._base_client = AsyncBaseClient(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            auth_type="bearer",
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._gateway_client = AsyncBaseClient(
+            api_key=api_key,
+            base_url=gateway_url,
+            timeout=timeout,
+            auth_type="api-key",
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+
+        # Initialize namespaces
+        self.file = AsyncFile(self._gateway_client, verify=upload_verify)
+        self.image = AsyncImage(self._base_client)
+        self.video = AsyncVideo(self._base_client)
+
+    async def close(self):
+        """Close the underlying HTTP connection pools."""
+        await self._base_client.close()
+        await self._gateway_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @property
+    def api_key(self) -> str:
+        """Get the API key."""
+        return self._base_client.api_key
+
+    @property
+    def base_url(self) -> str:
+        """Get the base URL."""
+        return self._base_client.base_url
+
+    @property
+    def gateway_url(self) -> str:
+        """Get the gateway URL."""
+        return self._gateway_client.base_url
+
+    @property
+    def timeout(self) -> int:
+        """Get the request timeout in seconds."""
+        return self._base_client.timeout
@@ -2,12 +2,27 @@
 
 import json
 from typing import Any, Dict, Optional
-from urllib.parse import urljoin
+from urllib.parse import urlsplit
+from urllib.request import getproxies, proxy_bypass_environment
 
 try:
     import httpx
+    HAS_HTTPX = True
 except ImportError:
     import requests as httpx  # Fallback to requests if httpx not available
+    HAS_HTTPX = False
+
+try:
+    import h2  # noqa: F401
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+try:
+    import orjson  # Faster JSON encoding/decoding when installed
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from .exceptions import (
     AuthenticationError,
@@ -16,6 +31,26 @@ from .exceptions import (
     APIError,
 )
 
+# Retry budget for the HTTP session. With httpx only failures to connect are
+# retried, so a request that may have reached the server is never re-sent;
+# the requests fallback also retries read errors and 429/5xx responses, but
+# only for idempotent methods (urllib3's Retry excludes POST).
+_CONNECT_RETRIES = 3
+
+
+def _environment_proxy(url: str) -> Optional[str]:
+    """Return the proxy URL the environment sets for ``url``, if any.
+
+    Follows HTTP(S)_PROXY, ALL_PROXY and NO_PROXY like httpx does for
+    clients that are not given an explicit transport.
+    """
+    proxies = getproxies()
+    parts = urlsplit(url)
+    proxy = proxies.get(parts.scheme) or proxies.get("all")
+    if not proxy or proxy_bypass_environment(parts.netloc, proxies):
+        return None
+    return proxy if "://" in proxy else f"http://{proxy}"
+
 
 class BaseClient:
     """Base HTTP client for making API requests."""
@@ -26,6 +61,8 @@ class BaseClient:
         base_url: str = "https://api.siray.ai",
         timeout: int = 120,
         auth_type: str = "bearer",
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
     ):
         """
         Initialize the base client.
@@ -35,12 +72,87 @@ class BaseClient:
             base_url: Base URL for the API (default: https://api.siray.ai)
             timeout: Request timeout in seconds (default: 120)
             auth_type: Authentication type - "bearer" or "api-key" (default: "bearer")
+            max_connections: Maximum number of concurrent connections (default: 100)
+            max_keepalive_connections: Maximum number of idle connections kept
+                open for reuse (default: 20)
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        # Prefix for the requests fallback, which needs absolute URLs
+        self._url_prefix = self.base_url + "/"
         self.timeout = timeout
         self.auth_type = auth_type.lower()
-        self.session = None
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        # Headers never change for a client, so build them once and install
+        # them on the session instead of rebuilding them per request.
+        self._headers = self._get_headers()
+
+        # Keep one pooled client for the lifetime of this object so repeated
+        # calls (e.g. task polling) reuse the same TCP/TLS connection.
+        self.session = self._create_session()
+
+    def _create_session(self):
+        """Create the pooled HTTP session."""
+        if not HAS_HTTPX:
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            # requests.request() builds a throwaway Session per call; keep one
+            # Session instead so the fallback path also reuses connections.
+            # Retry() leaves POST out of its allowed methods, so generation
+            # requests are only retried when the connection itself failed.
+            session = httpx.Session()
+            session.headers.update(self._headers)
+            adapter = HTTPAdapter(
+                pool_maxsize=self.max_keepalive_connections,
+                max_retries=Retry(
+                    total=_CONNECT_RETRIES,
+                    backoff_factor=0.3,
+                    status_forcelist=(429, 502, 503, 504),
+                    raise_on_status=False,
+                ),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            return session
+
+        return httpx.Client(**self._session_options(httpx.HTTPTransport))
+
+    def _session_options(self, transport_class) -> Dict[str, Any]:
+        """Get keyword arguments shared by the sync and async httpx clients."""
+        limits = httpx.Limits(
+            max_keepalive_connections=self.max_keepalive_connections,
+            max_connections=self.max_connections,
+            keepalive_expiry=30.0,
+        )
+        # Passing a transport turns off httpx's own HTTP(S)_PROXY/NO_PROXY
+        # handling, so apply the environment's proxy here; every request
+        # goes to base_url, so one lookup covers the whole session.
+        proxy = _environment_proxy(self.base_url)
+
+        return {
+            "base_url": self.base_url,
+            "headers": self._headers,
+            "timeout": self.timeout,
+            # Pool settings live on the transport once a transport is given.
+            "transport": transport_class(
+                limits=limits,
+                http2=HAS_HTTP2,
+                retries=_CONNECT_RETRIES,
+                proxy=None if proxy is None else httpx.Proxy(proxy),
+            ),
+        }
+
+    def close(self):
+        """Close the underlying HTTP connection pool."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests."""
@@ -79,6 +191,36 @@ class BaseClient:
         else:
             raise APIError(message, status_code=status_code)
 
+    def _body_kwargs(self, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Get the request keyword arguments that carry ``data`` as JSON."""
+        if data is None or not HAS_ORJSON:
+            return {"json": data}
+
+        try:
+            body = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the stdlib encoder accepts
+            return {"json": data}
+
+        # Content-Type is already set on the session headers
+        return {"content" if HAS_HTTPX else "data": body}
+
+    def _parse_response(self, response: Any) -> Dict[str, Any]:
+        """Decode a response body and raise for error status codes."""
+        try:
+            if HAS_ORJSON:
+                response_data = orjson.loads(response.content)
+            else:
+                response_data = response.json()
+        except (json.JSONDecodeError, ValueError):
+            response_data = {}
+
+        # Check for errors
+        if response.status_code >= 400:
+            self._handle_error_response(response.status_code, response_data)
+
+        return response_data
+
     def _request(
         self,
         method: str,
@@ -104,43 +246,26 @@ class BaseClient:
             InternalServerError: If the server encounters an error
             APIError: For other API errors
         """
-        url = urljoin(self.base_url + "/", endpoint.lstrip("/"))
-        headers = self._get_headers()
-
         try:
-            # Try using httpx first
-            if hasattr(httpx, 'Client'):
-                with httpx.Client() as client:
-                    response = client.request(
-                        method=method,
-                        url=url,
-                        json=data,
-                        params=params,
-                        headers=headers,
-                        timeout=self.timeout,
-                    )
+            # Try using the pooled httpx client first
+            if HAS_HTTPX:
+                response = self.session.request(
+                    method=method,
+                    url=endpoint.lstrip("/"),
+                    params=params,
+                    **self._body_kwargs(data),
+                )
             else:
-                # Fallback to requests
-                response = httpx.request(
+                # Fallback to the pooled requests session
+                response = self.session.request(
                     method=method,
-                    url=url,
-                    json=data,
+                    url=self._url_prefix + endpoint.lstrip("/"),
                     params=params,
-                    headers=headers,
                     timeout=self.timeout,
+                    **self._body_kwargs(data),
                 )
 
-            # Parse response
-            try:
-                response_data = response.json()
-            except (json.JSONDecodeError, ValueError):
-                response_data = {}
-
-            # Check for errors
-            if response.status_code >= 400:
-                self._handle_error_response(response.status_code, response_data)
-
-            return response_data
+            return self._parse_response(response)
 
         except (AuthenticationError, BadRequestError, InternalServerError, APIError):
             raise
@@ -162,3 +287,79 @@ class BaseClient:
     ) -> Dict[str, Any]:
         """Make a GET request."""
         return self._request("GET", endpoint, params=params)
+
+
+class AsyncBaseClient(BaseClient):
+    """Async HTTP client for making API requests.
+
+    Shares header and error handling with :class:`BaseClient` but issues
+    requests through a pooled ``httpx.AsyncClient``.
+    """
+
+    def _create_session(self):
+        """Create the pooled async HTTP session."""
+        if not HAS_HTTPX:
+            raise ImportError(
+                "httpx is required for the async client. "
+                "Install it with: pip install httpx"
+            )
+
+        return httpx.AsyncClient(**self._session_options(httpx.AsyncHTTPTransport))
+
+    async def close(self):
+        """Close the underlying HTTP connection pool."""
+        await self.session.aclose()
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with AsyncBaseClient")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make an HTTP request to the API.
+
+        See :meth:`BaseClient._request` for arguments and raised exceptions.
+        """
+        try:
+            response = await self.session.request(
+                method=method,
+                url=endpoint.lstrip("/"),
+                params=params,
+                **self._body_kwargs(data),
+            )
+            return self._parse_response(response)
+
+        except (AuthenticationError, BadRequestError, InternalServerError, APIError):
+            raise
+        except Exception as e:
+            raise APIError(f"Request failed: {str(e)}")
+
+    async def post(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make a POST request."""
+        return await self._request("POST", endpoint, data=data)
+
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make a GET request."""
+        return await self._request("GET", endpoint, params=params)
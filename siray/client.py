@@ -1,15 +1,82 @@
 """Main Siray SDK client."""
 
-import base64
-import mimetypes
+import mmap
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Sequence, Union
 
+try:
+    from pybase64 import b64encode  # SIMD-accelerated when available
+    HAS_PYBASE64 = True
+except ImportError:
+    from base64 import b64encode
+    HAS_PYBASE64 = False
+
+from ._mime import _guess_content_type
 from .base_client import BaseClient
 from .resources.file import File
 from .resources.image import Image
 from .resources.video import Video
 
+# Read size for load_from_local; a multiple of 3 keeps base64 output unpadded
+_ENCODE_CHUNK_SIZE = 3 * 1024 * 1024
+# Files above this size are encoded in parallel chunks; pybase64 releases
+# the GIL while encoding, so the threads actually run concurrently
+_PARALLEL_ENCODE_THRESHOLD = 32 * 1024 * 1024
+_ENCODE_WORKERS = min(4, os.cpu_count() or 1)
+# Files above this size are memory-mapped and encoded straight from the page
+# cache instead of being copied into per-chunk read buffers
+_MMAP_THRESHOLD = 64 * 1024 * 1024
+
+
+def _close_clients(*clients: BaseClient):
+    """Close the connection pools of ``clients``."""
+    for client in clients:
+        client.close()
+
+
+def _advise_sequential(fd: int):
+    """Hint the kernel that ``fd`` will be read front to back (POSIX only)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        pass
+
+
+def _b64encode_into(buf: bytearray, data):
+    """Base64-encode ``data`` in aligned chunks without copying it first."""
+    with memoryview(data) as view:
+        for offset in range(0, len(view), _ENCODE_CHUNK_SIZE):
+            with view[offset:offset + _ENCODE_CHUNK_SIZE] as chunk:
+                buf += b64encode(chunk)
+
+
+def _parallel_b64encode_into(buf: bytearray, data, workers: int):
+    """Base64-encode ``data`` on a thread pool, one window at a time.
+
+    Each window is ``workers`` aligned chunks of ``_ENCODE_CHUNK_SIZE`` bytes
+    and is appended to ``buf`` before the next one starts, so no more than a
+    window of encoded output is ever held outside ``buf``.
+    """
+    window = _ENCODE_CHUNK_SIZE * workers
+    with memoryview(data) as view, ThreadPoolExecutor(max_workers=workers) as executor:
+        for start in range(0, len(view), window):
+            end = min(start + window, len(view))
+            chunks = [
+                view[i:i + _ENCODE_CHUNK_SIZE] for i in range(start, end, _ENCODE_CHUNK_SIZE)
+            ]
+            try:
+                for encoded in executor.map(b64encode, chunks):
+                    buf += encoded
+            finally:
+                for chunk in chunks:
+                    chunk.release()
+
 
 class Siray:
     """
@@ -23,6 +90,9 @@ class Siray:
         image: Image generation namespace
         video: Video generation namespace
 
+    The client keeps pooled HTTP connections open; call :meth:`close` or use
+    it as a context manager to release them deterministically.
+
     Example:
         >>> from siray import Siray
         >>> client = Siray(api_key="your-api-key")
@@ -47,6 +117,9 @@ class Siray:
         base_url: str = "https://api.siray.ai",
         gateway_url: str = "https://api-gateway.siray.ai",
         timeout: int = 120,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        upload_verify: Optional[Union[bool, str]] = None,
     ):
         """
         Initialize the Siray client.
@@ -57,12 +130,18 @@ class Siray:
             base_url: Base URL for the API (default: https://api.siray.ai)
             gateway_url: Gateway URL for STS token (default: https://api-gateway.siray.ai)
             timeout: Request timeout in seconds (default: 120)
+            max_connections: Maximum concurrent connections per host pool (default: 100)
+            max_keepalive_connections: Maximum idle connections kept open for
+                reuse per host pool (default: 20). Lower it for mostly idle
+                clients; raise it for heavy concurrent fan-out.
+            upload_verify: Optional TLS verification for file uploads: a CA
+                bundle path, or False to disable certificate checks (default:
+                verify with the system/botocore CA bundle)
 
         Raises:
             ValueError: If no API key is provided or found in environment
         """
         if api_key is None:
-            import os
             api_key = os.environ.get("SIRAY_API_KEY")
 
         if not api_key:
@@ -72,17 +151,43 @@ class Siray:
             )
 
         self._base_client = BaseClient(
-            api_key=api_key, base_url=base_url, timeout=timeout, auth_type="bearer"
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            auth_type="bearer",
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
         )
         self._gateway_client = BaseClient(
-            api_key=api_key, base_url=gateway_url, timeout=timeout, auth_type="api-key"
+            api_key=api_key,
+            base_url=gateway_url,
+            timeout=timeout,
+            auth_type="api-key",
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
         )
 
         # Initialize namespaces
-        self.file = File(self._gateway_client)
+        self.file = File(self._gateway_client, verify=upload_verify)
         self.image = Image(self._base_client)
         self.video = Video(self._base_client)
 
+        # Release pooled sockets when the client is garbage collected, even
+        # if close() is never called; close() runs the same finalizer once.
+        self._finalizer = weakref.finalize(
+            self, _close_clients, self._base_client, self._gateway_client
+        )
+
+    def close(self):
+        """Close the underlying HTTP connection pools."""
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     @property
     def api_key(self) -> str:
         """Get the API key."""
@@ -105,7 +210,7 @@ class Siray:
 
     def load_from_local(
         self,
-        file_path: str,
+        file_path: Union[str, os.PathLike],
         *,
         mime_type: Optional[str] = None,
     ) -> str:
@@ -123,6 +228,59 @@ class Siray:
         Returns:
             Base64 encoded string representing the file contents.
 
+        Raises:
+            FileNotFoundError: If ``file_path`` does not point to a file.
+        """
+        return self.load_from_local_bytes(file_path, mime_type=mime_type).decode("ascii")
+
+    def load_from_local_batch(
+        self,
+        file_paths: Sequence[Union[str, os.PathLike]],
+        *,
+        max_workers: Optional[int] = None,
+    ) -> List[str]:
+        """Load several local files as base64 ``data:`` URIs.
+
+        Files are read concurrently so disk I/O for one file overlaps with
+        encoding of another, which helps when preparing many frames or
+        reference images at once.
+
+        Args:
+            file_paths: Paths to the local files to load.
+            max_workers: Maximum number of files loaded in parallel
+                (default: ``min(8, len(file_paths))``).
+
+        Returns:
+            List of data URIs, in the same order as ``file_paths``.
+
+        Raises:
+            FileNotFoundError: If any path does not point to a file.
+        """
+        if not file_paths:
+            return []
+
+        workers = max_workers or min(8, len(file_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.load_from_local, file_paths))
+
+    def load_from_local_bytes(
+        self,
+        file_path: Union[str, os.PathLike],
+        *,
+        mime_type: Optional[str] = None,
+    ) -> bytearray:
+        """Load a local file and return its ``data:`` URI as ASCII bytes.
+
+        Same as :meth:`load_from_local`, but skips the final bytes-to-str copy
+        for callers that can send bytes directly.
+
+        Args:
+            file_path: Path to the local file to upload.
+            mime_type: Optional MIME type override.
+
+        Returns:
+            Bytearray holding the ``data:<mime>;base64,<payload>`` URI.
+
         Raises:
             FileNotFoundError: If ``file_path`` does not point to a file.
         """
@@ -130,11 +288,37 @@ class Siray:
         if not path.is_file():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        detected_mime = mime_type
-        if not detected_mime:
-            detected_mime, _ = mimetypes.guess_type(str(path))
-        if not detected_mime:
-            detected_mime = "application/octet-stream"
+        detected_mime = (
+            mime_type
+            or _guess_content_type(path.suffix.lower())
+            or "application/octet-stream"
+        )
+
+        # Encode in 3-byte-aligned chunks so no padding lands mid-stream and
+        # the whole file never has to sit in memory next to its encoding.
+        buf = bytearray(b"data:" + detected_mime.encode("ascii") + b";base64,")
+        with path.open("rb") as f:
+            _advise_sequential(f.fileno())
+            size = os.fstat(f.fileno()).st_size
+            parallel = (
+                HAS_PYBASE64
+                and _ENCODE_WORKERS > 1
+                and size > _PARALLEL_ENCODE_THRESHOLD
+            )
+            if parallel or size > _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    if parallel:
+                        _parallel_b64encode_into(buf, mm, _ENCODE_WORKERS)
+                    else:
+                        _b64encode_into(buf, mm)
+                return buf
+
+            while True:
+                chunk = f.read(_ENCODE_CHUNK_SIZE)
+                if not chunk:
+                    break
+                buf += b64encode(chunk)
 
-        encoded = base64.b64encode(path.read_bytes()).decode("ascii")
-        return f"data:{detected_mime};base64,{encoded}"
+        return buf
@@ -1,10 +1,20 @@
 """Response models for Siray SDK."""
 
 from typing import Any, Dict, Optional, List
-from dataclasses import dataclass, field
+
+_COMPLETED_STATUSES = frozenset({"SUCCESS"})
+_FAILED_STATUSES = frozenset({"FAILURE", "FAILED"})
+_PROCESSING_STATUSES = frozenset({"NOT_START", "SUBMITTED", "QUEUED", "IN_PROGRESS"})
+
+
+def _parse_progress(progress: Any) -> Optional[int]:
+    """Parse a progress string such as ``"100%"`` into an integer percentage."""
+    if not isinstance(progress, str):
+        return None
+    value = progress.rstrip("%").strip()
+    return int(value) if value.isdecimal() else None
 
 
-@dataclass
 class GenerationResponse:
     """Response from an async generation request.
 
@@ -12,8 +22,10 @@ class GenerationResponse:
         task_id: Unique identifier for the generation task
         raw_response: Raw response data from the API
     """
+    __slots__ = ("task_id", "raw_response")
+
     task_id: str
-    raw_response: Dict[str, Any] = field(default_factory=dict, repr=False)
+    raw_response: Dict[str, Any]
 
     def __init__(self, data: Dict[str, Any]):
         """
@@ -25,12 +37,21 @@ class GenerationResponse:
         self.task_id = data.get("task_id", data.get("id", ""))
         self.raw_response = data
 
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(task_id={self.task_id!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.task_id, self.raw_response) == (other.task_id, other.raw_response)
+
+    __hash__ = None
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return self.raw_response
 
 
-@dataclass
 class TaskStatus:
     """Status of a generation task.
 
@@ -48,18 +69,34 @@ class TaskStatus:
         finish_time: Unix timestamp when task finished
         raw_response: Raw response data from the API
     """
+    # Fields shown in repr(), in declaration order; == also compares raw_response
+    _FIELDS = (
+        "code",
+        "message",
+        "task_id",
+        "action",
+        "status",
+        "outputs",
+        "fail_reason",
+        "progress",
+        "submit_time",
+        "start_time",
+        "finish_time",
+    )
+    __slots__ = _FIELDS + ("raw_response", "_status_upper", "_progress_percent")
+
     code: str
     message: str
     task_id: str
     action: str
     status: str
-    outputs: List[str] = field(default_factory=list)
-    fail_reason: Optional[str] = None
-    progress: Optional[str] = None
-    submit_time: Optional[int] = None
-    start_time: Optional[int] = None
-    finish_time: Optional[int] = None
-    raw_response: Dict[str, Any] = field(default_factory=dict, repr=False)
+    outputs: List[str]
+    fail_reason: Optional[str]
+    progress: Optional[str]
+    submit_time: Optional[int]
+    start_time: Optional[int]
+    finish_time: Optional[int]
+    raw_response: Dict[str, Any]
 
     def __init__(self, data: Dict[str, Any]):
         """
@@ -95,13 +132,29 @@ class TaskStatus:
         self.task_id = task_data.get("task_id", "")
         self.action = task_data.get("action", "")
         self.status = task_data.get("status", "UNKNOWN")
+        self._status_upper = (self.status or "").upper()
         self.outputs = task_data.get("outputs", [])
         self.fail_reason = task_data.get("fail_reason")
         self.progress = task_data.get("progress")
+        self._progress_percent = _parse_progress(self.progress)
         self.submit_time = task_data.get("submit_time")
         self.start_time = task_data.get("start_time")
         self.finish_time = task_data.get("finish_time")
 
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._FIELDS)
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in self._FIELDS + ("raw_response",)
+        )
+
+    __hash__ = None
+
     @property
     def result(self) -> Optional[str]:
         """Get the first output URL for backward compatibility."""
@@ -110,25 +163,19 @@ class TaskStatus:
     @property
     def progress_percent(self) -> Optional[int]:
         """Get progress as integer percentage (0-100)."""
-        if self.progress:
-            # Parse "100%" to 100
-            try:
-                return int(self.progress.rstrip('%'))
-            except (ValueError, AttributeError):
-                return None
-        return None
+        return self._progress_percent
 
     def is_completed(self) -> bool:
         """Check if the task is completed."""
-        return self.status.upper() in "SUCCESS"
+        return self._status_upper in _COMPLETED_STATUSES
 
     def is_failed(self) -> bool:
         """Check if the task has failed."""
-        return self.status.upper() in "FAILURE"
+        return self._status_upper in _FAILED_STATUSES
 
     def is_processing(self) -> bool:
         """Check if the task is still processing."""
-        return self.status.upper() in ("NOT_START", "SUBMITTED", "QUEUED", "IN_PROGRESS")
+        return self._status_upper in _PROCESSING_STATUSES
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -1,7 +1,7 @@
 """Resources for Siray SDK."""
 
-from .file import File
-from .image import Image
-from .video import Video
+from .file import AsyncFile, File
+from .image import AsyncImage, Image
+from .video import AsyncVideo, Video
 
-__all__ = ["File", "Image", "Video"]
+__all__ = ["File", "Image", "Video", "AsyncFile", "AsyncImage", "AsyncVideo"]
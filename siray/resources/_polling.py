@@ -0,0 +1,19 @@
+"""Shared polling helpers for task resources."""
+
+import random
+from typing import Iterator
+
+
+def _poll_delays(poll_interval: float, max_poll_interval: float) -> Iterator[float]:
+    """
+    Yield the waits between task status checks.
+
+    Starts at ``poll_interval`` (at least 0.1s) and grows by 1.5x per check up
+    to ``max_poll_interval``, since early polls rarely find the task finished.
+    Each wait gets up to 10% jitter so concurrent pollers spread out.
+    """
+    delay = max(poll_interval, 0.1)
+    max_poll_interval = max(max_poll_interval, delay)
+    while True:
+        yield delay + random.uniform(0, delay * 0.1)
+        delay = min(delay * 1.5, max_poll_interval)
@@ -1,34 +1,229 @@
 """File upload resource for Siray SDK."""
 
-import mimetypes
-import os
-from pathlib import Path
+import asyncio
+import time
+from datetime import datetime, timezone
+from pathlib import Path, PurePosixPath
+from typing import Optional, Tuple, Union
 
+from .._mime import _guess_content_type
 from ..base_client import BaseClient
-from ..upload.s3_uploader import S3Uploader
+from ..upload.s3_uploader import ProgressCallback, S3Uploader
 
+_STS_TOKEN_ENDPOINT = "/api/model-verse/sts-token"
 
-class File:
+# Lifetime assumed for STS credentials that carry no expiration, and how long
+# before expiry a cached token is considered stale.
+_STS_DEFAULT_TTL = 3000
+_STS_REFRESH_MARGIN = 60
+
+# S3 error codes meaning the STS credentials expired or were rejected
+_STS_CREDENTIAL_ERRORS = frozenset({
+    "AccessDenied",
+    "ExpiredToken",
+    "InvalidAccessKeyId",
+    "InvalidToken",
+    "RequestExpired",
+    "SignatureDoesNotMatch",
+    "TokenRefreshRequired",
+})
+
+
+def _parse_sts_response(response: dict) -> dict:
+    """Extract the STS payload from a token response."""
+    data = response.get("data", {})
+    if not data:
+        raise ValueError("Invalid STS token response: missing data field")
+
+    return data
+
+
+def _is_credential_error(error: Exception) -> bool:
+    """Return True if ``error`` is an S3 error caused by bad STS credentials."""
+    # botocore is imported lazily, so recognise its ClientError by shape
+    response = getattr(error, "response", None)
+    if not isinstance(response, dict):
+        return False
+    return response.get("Error", {}).get("Code") in _STS_CREDENTIAL_ERRORS
+
+
+def _sts_expires_at(sts_data: dict) -> float:
+    """Return the epoch time at which the STS credentials expire.
+
+    ``credentials.expiration`` may be an ISO 8601 timestamp or an epoch value
+    in seconds or milliseconds; anything missing or unparseable falls back to
+    a conservative default lifetime.
+    """
+    expiration = sts_data.get("credentials", {}).get("expiration")
+    try:
+        if isinstance(expiration, str) and not expiration.replace(".", "", 1).isdigit():
+            expires = datetime.fromisoformat(expiration.strip().replace("Z", "+00:00"))
+            if expires.tzinfo is None:
+                expires = expires.replace(tzinfo=timezone.utc)
+            return expires.timestamp()
+        if expiration is not None:
+            expires_at = float(expiration)
+            return expires_at / 1000 if expires_at > 1e12 else expires_at
+    except (TypeError, ValueError):
+        pass
+    return time.time() + _STS_DEFAULT_TTL
+
+
+def _create_uploader(sts_data: dict, verify: Optional[Union[bool, str]] = None) -> S3Uploader:
+    """Create an S3 uploader from the credentials in an STS token payload."""
+    credentials = sts_data.get("credentials", {})
+    bucket_name = sts_data.get("bucket_name")
+    upload_endpoint = sts_data.get("upload_endpoint")
+
+    if not credentials or not bucket_name:
+        raise ValueError("Invalid STS token response: missing credentials or bucket_name")
+
+    if not upload_endpoint:
+        raise ValueError("Invalid STS token response: missing upload_endpoint")
+
+    # Determine region (default to cn-bj if not provided)
+    region = credentials.get("region", "cn-bj")
+
+    # Create S3 uploader with temporary credentials
+    return S3Uploader(
+        access_key_id=credentials.get("access_key_id"),
+        secret_access_key=credentials.get("access_key_secret"),
+        session_token=credentials.get("security_token"),
+        region=region,
+        bucket_name=bucket_name,
+        endpoint_url=upload_endpoint,
+        access_endpoint=sts_data.get("access_endpoint"),
+        verify=verify,
+    )
+
+
+def _upload_with_sts(
+    uploader: S3Uploader,
+    path: Path,
+    upload_path: str,
+    chunk_size: Optional[int] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    multipart_threshold: Optional[int] = None,
+) -> str:
+    """Upload ``path`` under ``upload_path`` with an STS-backed uploader."""
+    # Object keys always use "/" regardless of the local platform; strip any
+    # leading slash and normalise backslashes a server might send.
+    clean_upload_path = upload_path.replace("\\", "/").lstrip("/")
+    object_key = str(PurePosixPath(clean_upload_path) / path.name)
+
+    # Infer content type from file extension
+    content_type = _guess_content_type(path.suffix.lower())
+
+    # Upload file
+    return uploader.upload_file(
+        file_path=str(path),
+        object_key=object_key,
+        content_type=content_type,
+        chunk_size=chunk_size,
+        progress_callback=progress_callback,
+        multipart_threshold=multipart_threshold,
+    )
+
+
+class _StsCache:
+    """STS token and S3 uploader cache shared by the sync and async resources."""
+
+    def __init__(self, client, verify: Optional[Union[bool, str]] = None):
+        self._client = client
+        self._verify = verify
+        self._sts_cache: Optional[dict] = None
+        self._uploader_cache: Optional[Tuple[tuple, S3Uploader]] = None
+
+    def _cached_sts_token(self) -> Optional[dict]:
+        """Return the cached STS payload unless it is about to expire."""
+        cache = self._sts_cache
+        if cache is not None and time.time() < cache["expires_at"] - _STS_REFRESH_MARGIN:
+            return cache["data"]
+        return None
+
+    def _cache_sts_token(self, sts_data: dict) -> dict:
+        self._sts_cache = {"data": sts_data, "expires_at": _sts_expires_at(sts_data)}
+        return sts_data
+
+    def _get_uploader(self, sts_data: dict) -> S3Uploader:
+        """Return an uploader for ``sts_data``, reusing the previous one if possible.
+
+        Reusing the uploader keeps its boto3 client and connection pool warm;
+        a refreshed token carries new credentials and gets a new uploader.
+        """
+        key = (
+            sts_data.get("bucket_name"),
+            sts_data.get("upload_endpoint"),
+            sts_data.get("credentials", {}).get("access_key_id"),
+        )
+        cached = self._uploader_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        uploader = _create_uploader(sts_data, self._verify)
+        self._uploader_cache = (key, uploader)
+        return uploader
+
+    def _discard_rejected_credentials(self, sts_data: dict, error: Exception) -> bool:
+        """Forget ``sts_data`` if S3 rejected its credentials.
+
+        Returns True if the upload is worth retrying with a fresh token. A
+        token fetched by another upload in the meantime is left in place.
+        """
+        if not _is_credential_error(error):
+            return False
+
+        cache = self._sts_cache
+        if cache is not None and cache["data"] is sts_data:
+            self._sts_cache = None
+            self._uploader_cache = None
+        return True
+
+    def _upload(
+        self,
+        sts_data: dict,
+        path: Path,
+        chunk_size: Optional[int],
+        progress_callback: Optional[ProgressCallback],
+        multipart_threshold: Optional[int],
+    ) -> str:
+        """Upload ``path`` with the (possibly cached) uploader for ``sts_data``."""
+        return _upload_with_sts(
+            self._get_uploader(sts_data),
+            path,
+            sts_data.get("upload_path", ""),
+            chunk_size,
+            progress_callback,
+            multipart_threshold,
+        )
+
+
+class File(_StsCache):
     """
     File resource for uploading files to Siray storage.
 
     This resource handles file uploads using S3 protocol with temporary
-    STS credentials. Files larger than 8MB are automatically uploaded
-    using multipart upload.
+    STS credentials. Files larger than 64MB are automatically uploaded
+    using multipart upload. The STS token and S3 client are reused across
+    uploads until the token is close to expiring; if S3 rejects the cached
+    credentials, the upload is retried once with a fresh token.
     """
 
-    def __init__(self, client: BaseClient):
+    def __init__(self, client: BaseClient, verify: Optional[Union[bool, str]] = None):
         """
         Initialize the File resource.
 
         Args:
             client: Base client instance for making API requests
+            verify: Optional TLS verification for uploads: a CA bundle path,
+                or False to disable certificate checks (default: verify with
+                the system/botocore CA bundle)
         """
-        self._client = client
+        super().__init__(client, verify)
 
     def _get_sts_token(self) -> dict:
         """
-        Fetch STS token from the API.
+        Fetch STS token from the API, or return the cached one if still valid.
 
         Returns:
             Dictionary containing credentials, bucket_name, upload_path,
@@ -37,24 +232,37 @@ class File:
         Raises:
             APIError: If the API request fails
         """
-        response = self._client.post("/api/model-verse/sts-token")
+        sts_data = self._cached_sts_token()
+        if sts_data is not None:
+            return sts_data
 
-        # Extract data from response
-        data = response.get("data", {})
-        if not data:
-            raise ValueError("Invalid STS token response: missing data field")
+        response = self._client.post(_STS_TOKEN_ENDPOINT)
+        return self._cache_sts_token(_parse_sts_response(response))
 
-        return data
-
-    def upload(self, file_path: str) -> str:
+    def upload(
+        self,
+        file_path: str,
+        chunk_size: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        multipart_threshold: Optional[int] = None,
+    ) -> str:
         """
         Upload a file to Siray storage.
 
-        Files larger than 8MB are automatically uploaded using multipart upload
-        with 8MB chunks. Smaller files use simple PUT upload.
+        Files larger than 64MB are automatically uploaded using multipart upload
+        with parts of at least 32MB, sized up for very large files to keep the
+        part count moderate. Smaller files use simple PUT upload.
 
         Args:
             file_path: Path to the local file to upload
+            chunk_size: Optional multipart part size in bytes (minimum 5MB).
+                Larger parts mean fewer requests but more memory per in-flight part.
+            progress_callback: Optional callable invoked as
+                ``progress_callback(bytes_uploaded, total_bytes)`` once a
+                simple upload finishes and after each multipart part
+            multipart_threshold: Optional size in bytes above which multipart
+                upload is used (default 64MB). Raise it to send larger files
+                with a single PUT.
 
         Returns:
             URL of the uploaded file
@@ -62,6 +270,7 @@ class File:
         Raises:
             FileNotFoundError: If file_path does not exist
             ImportError: If boto3 is not installed
+            ValueError: If chunk_size is below the S3 minimum part size
             APIError: If STS token request or upload fails
 
         Example:
@@ -77,47 +286,79 @@ class File:
         if not path.is_file():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # Get STS token
-        sts_data = self._get_sts_token()
-
-        credentials = sts_data.get("credentials", {})
-        bucket_name = sts_data.get("bucket_name")
-        upload_path = sts_data.get("upload_path", "")
-        upload_endpoint = sts_data.get("upload_endpoint")
-        access_endpoint = sts_data.get("access_endpoint")
-
-        if not credentials or not bucket_name:
-            raise ValueError("Invalid STS token response: missing credentials or bucket_name")
-
-        if not upload_endpoint:
-            raise ValueError("Invalid STS token response: missing upload_endpoint")
-
-        # Determine object key using upload_path + filename
-        filename = path.name
-        # Remove leading slash from upload_path if present
-        clean_upload_path = upload_path.lstrip("/")
-        object_key = os.path.join(clean_upload_path, filename).replace("\\", "/")
-
-        # Infer content type from file extension
-        content_type, _ = mimetypes.guess_type(str(path))
-
-        # Determine region (default to cn-bj if not provided)
-        region = credentials.get("region", "cn-bj")
-
-        # Create S3 uploader with temporary credentials
-        uploader = S3Uploader(
-            access_key_id=credentials.get("access_key_id"),
-            secret_access_key=credentials.get("access_key_secret"),
-            session_token=credentials.get("security_token"),
-            region=region,
-            bucket_name=bucket_name,
-            endpoint_url=upload_endpoint,
-            access_endpoint=access_endpoint,
-        )
+        # Retry once with a fresh token if S3 rejects cached credentials
+        for attempt in range(2):
+            sts_data = self._get_sts_token()
+            try:
+                return self._upload(
+                    sts_data, path, chunk_size, progress_callback, multipart_threshold
+                )
+            except Exception as e:
+                if attempt or not self._discard_rejected_credentials(sts_data, e):
+                    raise
+
+
+class AsyncFile(_StsCache):
+    """
+    Async file resource for uploading files to Siray storage.
+
+    The STS token is fetched with the async client; the S3 transfer itself
+    runs in the default executor so it does not block the event loop.
+    """
+
+    def __init__(self, client, verify: Optional[Union[bool, str]] = None):
+        """
+        Initialize the AsyncFile resource.
+
+        Args:
+            client: AsyncBaseClient instance for making API requests
+            verify: Optional TLS verification for uploads (see :class:`File`)
+        """
+        super().__init__(client, verify)
+
+    async def _get_sts_token(self) -> dict:
+        """Fetch STS token from the API, or return the cached one if still valid."""
+        sts_data = self._cached_sts_token()
+        if sts_data is not None:
+            return sts_data
+
+        response = await self._client.post(_STS_TOKEN_ENDPOINT)
+        return self._cache_sts_token(_parse_sts_response(response))
+
+    async def upload(
+        self,
+        file_path: str,
+        chunk_size: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        multipart_threshold: Optional[int] = None,
+    ) -> str:
+        """
+        Upload a file to Siray storage.
+
+        See :meth:`File.upload` for arguments, return value and exceptions.
+        ``progress_callback`` is invoked from the executor thread.
+        """
+        path = Path(file_path).expanduser()
+        if not path.is_file():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        loop = asyncio.get_running_loop()
+        # Retry once with a fresh token if S3 rejects cached credentials
+        for attempt in range(2):
+            sts_data = await self._get_sts_token()
+            try:
+                # The uploader is built in the executor too: creating it
+                # imports boto3 and builds a client, which would block the loop
+                return await loop.run_in_executor(
+                    None,
+                    self._upload,
+                    sts_data,
+                    path,
+                    chunk_size,
+                    progress_callback,
+                    multipart_threshold,
+                )
+            except Exception as e:
+                if attempt or not self._discard_rejected_credentials(sts_data, e):
+                    raise
 
-        # Upload file
-        return uploader.upload_file(
-            file_path=str(path),
-            object_key=object_key,
-            content_type=content_type,
-        )
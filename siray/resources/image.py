@@ -1,9 +1,15 @@
 """Image generation resources for Siray SDK."""
 
+import asyncio
 import time
 from typing import Any, Optional
 
 from ..models import GenerationResponse, TaskStatus
+from ._polling import _poll_delays
+
+# API routes, resolved once at import time
+_GENERATE_ENDPOINT = "/v1/images/generations/async"
+_TASK_ENDPOINT_PREFIX = _GENERATE_ENDPOINT + "/"
 
 
 class Image:
@@ -50,7 +56,7 @@ class Image:
             **kwargs,
         }
 
-        data = self._client.post("/v1/images/generations/async", data=payload)
+        data = self._client.post(_GENERATE_ENDPOINT, data=payload)
         return GenerationResponse(data)
 
     def query_task(self, task_id: str) -> TaskStatus:
@@ -79,7 +85,7 @@ class Image:
             >>> elif status.is_failed():
             ...     print(f"Error: {status.error}")
         """
-        data = self._client.get(f"/v1/images/generations/async/{task_id}")
+        data = self._client.get(f"{_TASK_ENDPOINT_PREFIX}{task_id}")
         return TaskStatus(data)
 
     def run(
@@ -88,6 +94,7 @@ class Image:
         prompt: str,
         poll_interval: float = 2.0,
         timeout: Optional[float] = None,
+        max_poll_interval: float = 30.0,
         **kwargs: Any,
     ) -> TaskStatus:
         """
@@ -96,8 +103,10 @@ class Image:
         Args:
             model: Model identifier
             prompt: Text prompt for image generation
-            poll_interval: Seconds to wait between status checks (default 2s)
+            poll_interval: Seconds to wait between the first two status checks (default 2s).
+                The first check runs immediately; the wait then grows by 1.5x per check.
             timeout: Maximum seconds to wait before raising TimeoutError (None disables)
+            max_poll_interval: Upper bound in seconds for the growing wait (default 30s)
             **kwargs: Additional model-specific parameters
 
         Returns:
@@ -107,7 +116,7 @@ class Image:
             TimeoutError: If timeout is reached while the task is still processing
         """
         response = self.generate_async(model=model, prompt=prompt, **kwargs)
-        poll_interval = max(poll_interval, 0.1)
+        delays = _poll_delays(poll_interval, max_poll_interval)
         start_time = time.monotonic()
 
         while True:
@@ -115,9 +124,108 @@ class Image:
             if not status.is_processing():
                 return status
 
-            if timeout is not None and (time.monotonic() - start_time) >= timeout:
+            elapsed = time.monotonic() - start_time
+            if timeout is not None and elapsed >= timeout:
+                raise TimeoutError(
+                    f"Image task {response.task_id} did not finish within {timeout} seconds"
+                )
+
+            # Never sleep past the timeout
+            sleep_for = next(delays)
+            if timeout is not None:
+                sleep_for = min(sleep_for, timeout - elapsed)
+            time.sleep(sleep_for)
+
+
+class AsyncImage:
+    """Async image generation namespace.
+
+    Mirrors :class:`Image` with coroutine methods so many tasks can be
+    started and polled concurrently, e.g. with ``asyncio.gather``.
+    """
+
+    def __init__(self, client):
+        """
+        Initialize the AsyncImage resource.
+
+        Args:
+            client: AsyncBaseClient instance for making API requests
+        """
+        self._client = client
+
+    async def generate_async(
+        self,
+        model: str,
+        prompt: str,
+        **kwargs: Any,
+    ) -> GenerationResponse:
+        """
+        Generate an image asynchronously using the specified model.
+
+        See :meth:`Image.generate_async` for arguments.
+        """
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            **kwargs,
+        }
+
+        data = await self._client.post(_GENERATE_ENDPOINT, data=payload)
+        return GenerationResponse(data)
+
+    async def query_task(self, task_id: str) -> TaskStatus:
+        """
+        Query the status and result of an image generation task.
+
+        See :meth:`Image.query_task` for arguments.
+        """
+        data = await self._client.get(f"{_TASK_ENDPOINT_PREFIX}{task_id}")
+        return TaskStatus(data)
+
+    async def run(
+        self,
+        model: str,
+        prompt: str,
+        poll_interval: float = 2.0,
+        timeout: Optional[float] = None,
+        max_poll_interval: float = 30.0,
+        **kwargs: Any,
+    ) -> TaskStatus:
+        """
+        Start an async generation and poll until it finishes without blocking the event loop.
+
+        See :meth:`Image.run` for arguments.
+
+        Example:
+            >>> client = AsyncSiray(api_key="your-api-key")
+            >>> statuses = await asyncio.gather(
+            ...     client.image.run(
+            ...         model="black-forest-labs/flux-1.1-pro-ultra-i2i",
+            ...         prompt="A beautiful sunset over mountains",
+            ...     ),
+            ...     client.image.run(
+            ...         model="black-forest-labs/flux-1.1-pro-ultra-i2i",
+            ...         prompt="A beautiful sunset over mountains",
+            ...     ),
+            ... )
+        """
+        response = await self.generate_async(model=model, prompt=prompt, **kwargs)
+        delays = _poll_delays(poll_interval, max_poll_interval)
+        start_time = time.monotonic()
+
+        while True:
+            status = await self.query_task(response.task_id)
+            if not status.is_processing():
+                return status
+
+            elapsed = time.monotonic() - start_time
+            if timeout is not None and elapsed >= timeout:
                 raise TimeoutError(
                     f"Image task {response.task_id} did not finish within {timeout} seconds"
                 )
 
-            time.sleep(poll_interval)
+            # Never sleep past the timeout
+            sleep_for = next(delays)
+            if timeout is not None:
+                sleep_for = min(sleep_for, timeout - elapsed)
+            await asyncio.sleep(sleep_for)
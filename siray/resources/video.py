@@ -1,9 +1,15 @@
 """Video generation resources for Siray SDK."""
 
+import asyncio
 import time
 from typing import Any, Optional
 
 from ..models import GenerationResponse, TaskStatus
+from ._polling import _poll_delays
+
+# API routes, resolved once at import time
+_GENERATE_ENDPOINT = "/v1/video/generations"
+_TASK_ENDPOINT_PREFIX = _GENERATE_ENDPOINT + "/"
 
 
 class Video:
@@ -49,7 +55,7 @@ class Video:
             **kwargs,
         }
 
-        data = self._client.post("/v1/video/generations", data=payload)
+        data = self._client.post(_GENERATE_ENDPOINT, data=payload)
         return GenerationResponse(data)
 
     def query_task(self, task_id: str) -> TaskStatus:
@@ -77,7 +83,7 @@ class Video:
             >>> elif status.is_failed():
             ...     print(f"Error: {status.fail_reason}")
         """
-        data = self._client.get(f"/v1/video/generations/{task_id}")
+        data = self._client.get(f"{_TASK_ENDPOINT_PREFIX}{task_id}")
         return TaskStatus(data)
 
     def run(
@@ -86,6 +92,7 @@ class Video:
         prompt: str,
         poll_interval: float = 2.0,
         timeout: Optional[float] = None,
+        max_poll_interval: float = 30.0,
         **kwargs: Any,
     ) -> TaskStatus:
         """
@@ -94,8 +101,10 @@ class Video:
         Args:
             model: Model identifier
             prompt: Text prompt for video generation
-            poll_interval: Seconds between task status checks (default 2s)
+            poll_interval: Seconds to wait between the first two status checks (default 2s).
+                The first check runs immediately; the wait then grows by 1.5x per check.
             timeout: Maximum seconds to wait before raising TimeoutError (None disables)
+            max_poll_interval: Upper bound in seconds for the growing wait (default 30s)
             **kwargs: Additional model-specific parameters
 
         Returns:
@@ -105,7 +114,7 @@ class Video:
             TimeoutError: If timeout is reached before the task resolves
         """
         response = self.generate_async(model=model, prompt=prompt, **kwargs)
-        poll_interval = max(poll_interval, 0.1)
+        delays = _poll_delays(poll_interval, max_poll_interval)
         start_time = time.monotonic()
 
         while True:
@@ -113,9 +122,102 @@ class Video:
             if not status.is_processing():
                 return status
 
-            if timeout is not None and (time.monotonic() - start_time) >= timeout:
+            elapsed = time.monotonic() - start_time
+            if timeout is not None and elapsed >= timeout:
+                raise TimeoutError(
+                    f"Video task {response.task_id} did not finish within {timeout} seconds"
+                )
+
+            # Never sleep past the timeout
+            sleep_for = next(delays)
+            if timeout is not None:
+                sleep_for = min(sleep_for, timeout - elapsed)
+            time.sleep(sleep_for)
+
+
+class AsyncVideo:
+    """Async video generation namespace.
+
+    Mirrors :class:`Video` with coroutine methods so many tasks can be
+    started and polled concurrently, e.g. with ``asyncio.gather``.
+    """
+
+    def __init__(self, client):
+        """
+        Initialize the AsyncVideo resource.
+
+        Args:
+            client: AsyncBaseClient instance for making API requests
+        """
+        self._client = client
+
+    async def generate_async(
+        self,
+        model: str,
+        prompt: str,
+        **kwargs: Any,
+    ) -> GenerationResponse:
+        """
+        Generate a video asynchronously using the specified model.
+
+        See :meth:`Video.generate_async` for arguments.
+        """
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            **kwargs,
+        }
+
+        data = await self._client.post(_GENERATE_ENDPOINT, data=payload)
+        return GenerationResponse(data)
+
+    async def query_task(self, task_id: str) -> TaskStatus:
+        """
+        Query the status and result of a video generation task.
+
+        See :meth:`Video.query_task` for arguments.
+        """
+        data = await self._client.get(f"{_TASK_ENDPOINT_PREFIX}{task_id}")
+        return TaskStatus(data)
+
+    async def run(
+        self,
+        model: str,
+        prompt: str,
+        poll_interval: float = 2.0,
+        timeout: Optional[float] = None,
+        max_poll_interval: float = 30.0,
+        **kwargs: Any,
+    ) -> TaskStatus:
+        """
+        Start an async generation and poll until it finishes without blocking the event loop.
+
+        See :meth:`Video.run` for arguments.
+
+        Example:
+            >>> client = AsyncSiray(api_key="your-api-key")
+            >>> statuses = await asyncio.gather(
+            ...     client.video.run(model="your-video-model", prompt="A cat playing piano"),
+            ...     client.video.run(model="your-video-model", prompt="A cat playing piano"),
+            ... )
+        """
+        response = await self.generate_async(model=model, prompt=prompt, **kwargs)
+        delays = _poll_delays(poll_interval, max_poll_interval)
+        start_time = time.monotonic()
+
+        while True:
+            status = await self.query_task(response.task_id)
+            if not status.is_processing():
+                return status
+
+            elapsed = time.monotonic() - start_time
+            if timeout is not None and elapsed >= timeout:
                 raise TimeoutError(
                     f"Video task {response.task_id} did not finish within {timeout} seconds"
                 )
 
-            time.sleep(poll_interval)
+            # Never sleep past the timeout
+            sleep_for = next(delays)
+            if timeout is not None:
+                sleep_for = min(sleep_for, timeout - elapsed)
+            await asyncio.sleep(sleep_for)
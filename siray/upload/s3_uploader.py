@@ -1,23 +1,88 @@
 """S3 uploader with support for multipart uploads."""
 
+import importlib.util
+import io
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Union
 
-try:
-    import boto3
-    from botocore.exceptions import ClientError
-    HAS_BOTO3 = True
-except ImportError:
-    HAS_BOTO3 = False
+# Called as progress_callback(bytes_uploaded, total_bytes)
+ProgressCallback = Callable[[int, int], None]
+
+# boto3 takes hundreds of milliseconds to import, so it is only imported
+# once an uploader is actually created.
+HAS_BOTO3 = importlib.util.find_spec("boto3") is not None
+
+
+class _MappedPart(io.RawIOBase):
+    """Read-only, seekable file-like view of one part of a memory-mapped file.
+
+    botocore only accepts bytes or file-like bodies, so this lets a part be
+    streamed (and re-read for checksums or retries) straight from the page
+    cache instead of being copied into a part-sized bytes object first.
+    """
+
+    def __init__(self, mm: mmap.mmap, offset: int, length: int):
+        self._view = memoryview(mm)[offset:offset + length]
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, min(offset, len(self._view)))
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._view)
+        if size is not None and size >= 0:
+            end = min(self._pos + size, end)
+        data = self._view[self._pos:end].tobytes()
+        self._pos = end
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        self._view.release()
+        super().close()
 
 
 class S3Uploader:
     """Handle S3 uploads with automatic multipart support for large files."""
 
-    # 8MB threshold and chunk size
-    MULTIPART_THRESHOLD = 8 * 1024 * 1024  # 8MB
-    CHUNK_SIZE = 8 * 1024 * 1024  # 8MB
+    # Files up to the threshold use a single PUT. Above it, the part size is
+    # picked from the file size: at least CHUNK_SIZE, growing to keep roughly
+    # TARGET_PART_COUNT parts, capped at CHUNK_SIZE_MAX. Larger parts mean
+    # fewer per-part requests, at the cost of more memory per in-flight part.
+    MULTIPART_THRESHOLD = 64 * 1024 * 1024  # 64MB
+    CHUNK_SIZE = 32 * 1024 * 1024  # 32MB
+    CHUNK_SIZE_MAX = 256 * 1024 * 1024  # 256MB
+    TARGET_PART_COUNT = 64
+    # S3 rejects parts (other than the last) smaller than 5MB, and uploads
+    # with more than 10000 parts
+    MIN_CHUNK_SIZE = 5 * 1024 * 1024  # 5MB
+    MAX_PART_COUNT = 10000
+    # Default number of parts uploaded in parallel
+    MAX_CONCURRENCY = 8
 
     def __init__(
         self,
@@ -28,6 +93,10 @@ class S3Uploader:
         bucket_name: str,
         endpoint_url: Optional[str] = None,
         access_endpoint: Optional[str] = None,
+        multipart_threshold: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        verify: Optional[Union[bool, str]] = None,
     ):
         """
         Initialize S3 uploader with temporary credentials.
@@ -40,9 +109,19 @@ class S3Uploader:
             bucket_name: S3 bucket name
             endpoint_url: Optional custom S3 endpoint URL for upload
             access_endpoint: Optional custom S3 endpoint URL for access
+            multipart_threshold: Optional size in bytes above which multipart
+                upload is used (default: MULTIPART_THRESHOLD)
+            chunk_size: Optional multipart part size in bytes, at least 5MB
+                (default: chosen per file from its size)
+            max_concurrency: Optional number of parts uploaded in parallel
+                (default: MAX_CONCURRENCY)
+            verify: Optional TLS verification setting: a CA bundle path, or
+                False to disable certificate checks (default: verify with the
+                system/botocore CA bundle)
 
         Raises:
             ImportError: If boto3 is not installed
+            ValueError: If chunk_size is below the S3 minimum part size
         """
         if not HAS_BOTO3:
             raise ImportError(
@@ -53,31 +132,50 @@ class S3Uploader:
         self.bucket_name = bucket_name
         self.region = region
         self.access_endpoint = access_endpoint
+        self.multipart_threshold = (
+            self.MULTIPART_THRESHOLD if multipart_threshold is None else multipart_threshold
+        )
+        self.chunk_size = self._validate_chunk_size(chunk_size) if chunk_size else None
+        self.max_concurrency = max_concurrency or self.MAX_CONCURRENCY
 
-        # Create S3 client configuration for UCloud US3 compatibility
+        import boto3
         from botocore.client import Config
 
+        # Create S3 client configuration for UCloud US3 compatibility
+
+        # Retry throttling and transient network errors per request, so one
+        # flaky part does not abort a large multipart upload. The pool is
+        # sized so concurrent uploads sharing this client keep their
+        # connections alive instead of re-doing TLS handshakes per part.
         config = Config(
             signature_version='s3v4',
-            s3={'addressing_style': 'path'}
+            s3={'addressing_style': 'path'},
+            retries={'max_attempts': 5, 'mode': 'standard'},
+            max_pool_connections=max(32, 2 * self.max_concurrency),
+            tcp_keepalive=True,
         )
 
         # Create S3 client with temporary credentials
-        self.s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=access_key_id,
-            aws_secret_access_key=secret_access_key,
-            aws_session_token=session_token,
-            region_name=region,
-            endpoint_url=endpoint_url,
-            config=config,
-        )
+        self._client_kwargs = {
+            "aws_access_key_id": access_key_id,
+            "aws_secret_access_key": secret_access_key,
+            "aws_session_token": session_token,
+            "region_name": region,
+            "endpoint_url": endpoint_url,
+            "verify": verify,
+        }
+        self.s3_client = boto3.client("s3", config=config, **self._client_kwargs)
+        # Short-timeout client for aborting failed uploads, built on first use
+        self._abort_client = None
 
     def upload_file(
         self,
         file_path: str,
         object_key: str,
         content_type: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        multipart_threshold: Optional[int] = None,
     ) -> str:
         """
         Upload a file to S3 with automatic multipart support.
@@ -86,6 +184,13 @@ class S3Uploader:
             file_path: Path to the local file to upload
             object_key: S3 object key (path in bucket)
             content_type: Optional MIME type of the file
+            chunk_size: Optional multipart part size in bytes, at least 5MB
+                (default: the uploader's chunk_size, else chosen from the file size)
+            progress_callback: Optional callable invoked as
+                ``progress_callback(bytes_uploaded, total_bytes)`` after the
+                upload and after each multipart part completes
+            multipart_threshold: Optional size in bytes above which this
+                upload uses multipart (default: the uploader's threshold)
 
         Returns:
             S3 URL of the uploaded file
@@ -93,45 +198,66 @@ class S3Uploader:
         Raises:
             FileNotFoundError: If file_path does not exist
             ClientError: If S3 upload fails
+            ValueError: If chunk_size is below the S3 minimum part size
         """
         path = Path(file_path).expanduser()
         if not path.is_file():
             raise FileNotFoundError(f"File not found: {file_path}")
 
         file_size = path.stat().st_size
+        if multipart_threshold is None:
+            multipart_threshold = self.multipart_threshold
 
         # Determine upload strategy based on file size
-        if file_size > self.MULTIPART_THRESHOLD:
-            return self._multipart_upload(path, object_key, content_type)
+        if file_size > multipart_threshold:
+            chunk_size = chunk_size or self.chunk_size
+            if chunk_size:
+                self._validate_chunk_size(chunk_size)
+            else:
+                chunk_size = self._auto_chunk_size(file_size)
+            return self._multipart_upload(
+                path, object_key, chunk_size, content_type, progress_callback
+            )
         else:
-            return self._simple_upload(path, object_key, content_type)
+            return self._simple_upload(path, object_key, content_type, progress_callback)
 
     def _simple_upload(
         self,
         file_path: Path,
         object_key: str,
         content_type: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> str:
         """Upload file using simple PUT operation."""
         extra_args = {}
         if content_type:
             extra_args["ContentType"] = content_type
 
+        # botocore streams file bodies (checksums are computed in a streaming
+        # pass), so the file is never read into memory; passing the length
+        # up front saves it from probing the file object for it.
         with open(file_path, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=object_key,
                 Body=f,
+                ContentLength=file_size,
                 **extra_args,
             )
 
+        if progress_callback:
+            progress_callback(file_size, file_size)
+
         return self._get_object_url(object_key)
 
     def _multipart_upload(
         self,
         file_path: Path,
         object_key: str,
+        chunk_size: int,
         content_type: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> str:
         """Upload file using multipart upload for large files."""
         # Initiate multipart upload
@@ -146,32 +272,42 @@ class S3Uploader:
         )
         upload_id = mpu["UploadId"]
 
-        parts = []
-        part_number = 1
-
+        completed = False
         try:
-            with open(file_path, "rb") as f:
-                while True:
-                    # Read chunk
-                    data = f.read(self.CHUNK_SIZE)
-                    if not data:
-                        break
-
-                    # Upload part
-                    response = self.s3_client.upload_part(
-                        Bucket=self.bucket_name,
-                        Key=object_key,
-                        PartNumber=part_number,
-                        UploadId=upload_id,
-                        Body=data,
-                    )
-
-                    parts.append({
-                        "PartNumber": part_number,
-                        "ETag": response["ETag"],
-                    })
-
-                    part_number += 1
+            # Each worker streams its part from a read-only mapping of the
+            # file, so part bodies are never copied into memory up front.
+            with open(file_path, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                    futures = [
+                        executor.submit(
+                            self._upload_part,
+                            mm, object_key, upload_id, part_number, offset, chunk_size,
+                        )
+                        for part_number, offset in enumerate(
+                            range(0, len(mm), chunk_size), start=1
+                        )
+                    ]
+                    # Report progress from this thread as parts finish
+                    total = len(mm)
+                    uploaded = 0
+                    parts = []
+                    try:
+                        for future in as_completed(futures):
+                            part = future.result()
+                            parts.append(part)
+                            if progress_callback:
+                                offset = (part["PartNumber"] - 1) * chunk_size
+                                uploaded += min(chunk_size, total - offset)
+                                progress_callback(uploaded, total)
+                    except Exception:
+                        # Don't start queued parts of an upload we abort, whether
+                        # a part or the progress callback failed
+                        for pending in futures:
+                            pending.cancel()
+                        raise
+
+                    parts.sort(key=lambda part: part["PartNumber"])
 
             # Complete multipart upload
             self.s3_client.complete_multipart_upload(
@@ -180,17 +316,82 @@ class S3Uploader:
                 UploadId=upload_id,
                 MultipartUpload={"Parts": parts},
             )
+            completed = True
+
+        except Exception:
+            if not completed:
+                self._abort_multipart_upload(object_key, upload_id)
+            raise
+
+        return self._get_object_url(object_key)
+
+    def _abort_multipart_upload(self, object_key: str, upload_id: str):
+        """Abort a failed multipart upload on a best-effort basis.
 
-        except Exception as e:
-            # Abort multipart upload on error
-            self.s3_client.abort_multipart_upload(
+        The abort uses short timeouts and its own errors are swallowed, so a
+        flaky network cannot stall or mask the error that caused it.
+        """
+        try:
+            if self._abort_client is None:
+                import boto3
+                from botocore.client import Config
+
+                config = self.s3_client.meta.config.merge(Config(
+                    connect_timeout=5,
+                    read_timeout=5,
+                    retries={'max_attempts': 2, 'mode': 'standard'},
+                ))
+                self._abort_client = boto3.client("s3", config=config, **self._client_kwargs)
+
+            self._abort_client.abort_multipart_upload(
                 Bucket=self.bucket_name,
                 Key=object_key,
                 UploadId=upload_id,
             )
-            raise e
+        except Exception:
+            pass
 
-        return self._get_object_url(object_key)
+    def _auto_chunk_size(self, file_size: int) -> int:
+        """Pick a part size that splits ``file_size`` into a moderate number of parts."""
+        mib = 1024 * 1024
+        chunk_size = -(-file_size // self.TARGET_PART_COUNT)  # ceiling division
+        chunk_size = max(self.CHUNK_SIZE, min(self.CHUNK_SIZE_MAX, chunk_size))
+        # Very large files must still fit within the S3 part count limit
+        chunk_size = max(chunk_size, -(-file_size // self.MAX_PART_COUNT))
+        return -(-chunk_size // mib) * mib
+
+    def _validate_chunk_size(self, chunk_size: int) -> int:
+        """Ensure a multipart part size meets the S3 minimum."""
+        if chunk_size < self.MIN_CHUNK_SIZE:
+            raise ValueError(
+                f"chunk_size must be at least {self.MIN_CHUNK_SIZE} bytes (S3 minimum part size)"
+            )
+
+        return chunk_size
+
+    def _upload_part(
+        self,
+        mm: mmap.mmap,
+        object_key: str,
+        upload_id: str,
+        part_number: int,
+        offset: int,
+        chunk_size: int,
+    ) -> Dict[str, Any]:
+        """Upload one part of a multipart upload and return its part entry."""
+        with _MappedPart(mm, offset, chunk_size) as body:
+            response = self.s3_client.upload_part(
+                Bucket=self.bucket_name,
+                Key=object_key,
+                PartNumber=part_number,
+                UploadId=upload_id,
+                Body=body,
+            )
+
+        return {
+            "PartNumber": part_number,
+            "ETag": response["ETag"],
+        }
 
     def _get_object_url(self, object_key: str) -> str:
         """Get the URL for an uploaded object."""
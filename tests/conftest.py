@@ -0,0 +1,34 @@
+"""Shared fixtures for the Siray test suite."""
+
+import pytest
+
+from siray import Siray
+
+
+@pytest.fixture(scope="session")
+def siray_client():
+    """Default client shared by tests that don't exercise construction."""
+    client = Siray(api_key="test-api-key")
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def siray_env_key(monkeypatch):
+    """Set SIRAY_API_KEY for the duration of a test and return its value."""
+    monkeypatch.setenv("SIRAY_API_KEY", "env-test-key")
+    return "env-test-key"
+
+
+@pytest.fixture
+def no_siray_env(monkeypatch):
+    """Ensure SIRAY_API_KEY is unset for the duration of a test."""
+    monkeypatch.delenv("SIRAY_API_KEY", raising=False)
+
+
+@pytest.fixture(scope="session")
+def sample_jpeg(tmp_path_factory):
+    """Small JPEG-named sample file written once per session."""
+    path = tmp_path_factory.mktemp("assets") / "sample.jpg"
+    path.write_bytes(b"sample-bytes")
+    return path
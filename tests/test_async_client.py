@@ -0,0 +1,91 @@
+"""Tests for the async Siray client."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from siray import AsyncSiray
+
+
+def _mock_session(client, handler):
+    """Route the client's API requests through an in-memory transport."""
+    return httpx.AsyncClient(
+        base_url=client.base_url,
+        transport=httpx.MockTransport(handler),
+    )
+
+
+class TestAsyncSirayClient:
+    """Test AsyncSiray client initialization and basic functionality."""
+
+    def test_client_initialization_with_api_key(self):
+        """Test client initialization with API key parameter."""
+        client = AsyncSiray(api_key="test-api-key", timeout=60)
+        assert client.api_key == "test-api-key"
+        assert client.base_url == "https://api.siray.ai"
+        assert client.timeout == 60
+
+    @pytest.mark.usefixtures("no_siray_env")
+    def test_client_initialization_without_api_key_raises_error(self):
+        """Test that missing API key raises ValueError."""
+        with pytest.raises(ValueError, match="API key must be provided"):
+            AsyncSiray()
+
+    def test_client_has_async_namespaces(self):
+        """Test that namespace methods are coroutine functions."""
+        client = AsyncSiray(api_key="test-api-key")
+        assert asyncio.iscoroutinefunction(client.file.upload)
+        for namespace in (client.image, client.video):
+            assert asyncio.iscoroutinefunction(namespace.generate_async)
+            assert asyncio.iscoroutinefunction(namespace.query_task)
+            assert asyncio.iscoroutinefunction(namespace.run)
+
+    def test_context_manager_closes_connection_pools(self):
+        """Test that leaving the async context closes pooled sessions."""
+
+        async def main():
+            async with AsyncSiray(api_key="test-api-key") as client:
+                pass
+            return client
+
+        client = asyncio.run(main())
+        assert client._base_client.session.is_closed
+        assert client._gateway_client.session.is_closed
+
+
+class TestAsyncRun:
+    """Test the async polling helper."""
+
+    def test_run_polls_until_task_finishes(self):
+        """Test that run polls the task endpoint until it leaves processing."""
+        statuses = iter(["IN_PROGRESS", "SUCCESS"])
+        requests = []
+
+        def handler(request):
+            requests.append((request.method, request.url.path))
+            if request.method == "POST":
+                return httpx.Response(200, json={"task_id": "task-1"})
+            return httpx.Response(
+                200,
+                json={
+                    "code": "success",
+                    "data": {"task_id": "task-1", "status": next(statuses), "outputs": ["url"]},
+                },
+            )
+
+        async def main():
+            client = AsyncSiray(api_key="test-api-key")
+            client._base_client.session = _mock_session(client, handler)
+            async with client:
+                return await client.video.run(model="m", prompt="p", poll_interval=0.1)
+
+        status = asyncio.run(main())
+
+        assert status.is_completed()
+        assert status.result == "url"
+        assert requests == [
+            ("POST", "/v1/video/generations"),
+            ("GET", "/v1/video/generations/task-1"),
+            ("GET", "/v1/video/generations/task-1"),
+        ]
@@ -0,0 +1,140 @@
+"""Tests for the base HTTP client."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import httpx
+import pytest
+
+from siray import base_client
+from siray.base_client import BaseClient
+from siray.exceptions import BadRequestError
+
+
+def _client_with_handler(handler):
+    client = BaseClient(api_key="test-api-key", base_url="https://api.example.com")
+    client.session.close()
+    client.session = httpx.Client(
+        base_url=client.base_url,
+        headers=client._headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+@pytest.fixture
+def proxy_env(monkeypatch):
+    """Start from an environment without any proxy settings."""
+    for name in ("HTTP", "HTTPS", "ALL", "NO"):
+        monkeypatch.delenv(f"{name}_PROXY", raising=False)
+        monkeypatch.delenv(f"{name.lower()}_proxy", raising=False)
+    return monkeypatch
+
+
+@pytest.fixture
+def echo_server():
+    """A local HTTP server that answers with the request target it received."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = json.dumps({"target": self.path}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestBaseClient:
+    """Test request encoding and response handling."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize(
+        "data, body",
+        [
+            ({"prompt": "ünïcode"}, {"prompt": "ünïcode"}),
+            ({"loras": {1: 0.5}}, {"loras": {"1": 0.5}}),
+            ({"seed": 2**70}, {"seed": 2**70}),
+        ],
+    )
+    def test_post_round_trips_json(self, monkeypatch, use_orjson, data, body):
+        if use_orjson and not base_client.HAS_ORJSON:
+            pytest.skip("orjson is not installed")
+        monkeypatch.setattr(base_client, "HAS_ORJSON", use_orjson)
+        seen = {}
+
+        def handler(request):
+            seen["url"] = str(request.url)
+            seen["content_type"] = request.headers["Content-Type"]
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(200, json={"task_id": "task-1"})
+
+        client = _client_with_handler(handler)
+
+        assert client.post("/v1/tasks", data=data) == {"task_id": "task-1"}
+        assert seen == {
+            "url": "https://api.example.com/v1/tasks",
+            "content_type": "application/json",
+            "body": body,
+        }
+
+    def test_error_response_raises_typed_error(self):
+        def handler(request):
+            return httpx.Response(
+                400, json={"error": {"message": "bad", "code": "invalid", "type": "validation"}}
+            )
+
+        client = _client_with_handler(handler)
+
+        with pytest.raises(BadRequestError) as exc_info:
+            client.get("/v1/tasks/1")
+        assert exc_info.value.code == "invalid"
+
+    def test_non_json_response_is_empty_dict(self):
+        client = _client_with_handler(lambda request: httpx.Response(200, content=b"ok"))
+        assert client.get("/health") == {}
+
+    def test_session_pools_and_retries_connects(self, monkeypatch):
+        created = []
+
+        class RecordingTransport(httpx.HTTPTransport):
+            def __init__(self, **kwargs):
+                created.append(kwargs)
+                super().__init__(**kwargs)
+
+        monkeypatch.setattr(httpx, "HTTPTransport", RecordingTransport)
+        BaseClient(
+            api_key="test-api-key", max_connections=4, max_keepalive_connections=2
+        ).close()
+
+        (kwargs,) = created
+        assert kwargs["limits"] == httpx.Limits(
+            max_connections=4, max_keepalive_connections=2, keepalive_expiry=30.0
+        )
+        assert kwargs["retries"] == base_client._CONNECT_RETRIES
+
+    def test_session_honours_environment_proxy(self, proxy_env, echo_server):
+        proxy_env.setenv("HTTP_PROXY", echo_server)
+        client = BaseClient(api_key="test-api-key", base_url="http://api.siray.test")
+
+        # A proxy sees the absolute URL in the request line
+        assert client.get("/v1/tasks/1") == {"target": "http://api.siray.test/v1/tasks/1"}
+        client.close()
+
+    def test_no_proxy_bypasses_environment_proxy(self, proxy_env, echo_server):
+        proxy_env.setenv("HTTP_PROXY", "http://127.0.0.1:9")
+        proxy_env.setenv("NO_PROXY", "127.0.0.1")
+        client = BaseClient(api_key="test-api-key", base_url=echo_server)
+
+        assert client.get("/v1/tasks/1") == {"target": "/v1/tasks/1"}
+        client.close()
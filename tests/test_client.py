@@ -1,10 +1,10 @@
 """Tests for Siray client."""
 
-import base64
-import os
+import gc
+from base64 import b64encode
+
 import pytest
 
-from examples.image_generation import client
 from siray import Siray
 from siray.exceptions import (
     SirayError,
@@ -12,10 +12,20 @@ from siray.exceptions import (
     BadRequestError,
 )
 
+# Methods every generation namespace must provide
+_NAMESPACE_METHODS = {"generate_async", "query_task", "run"}
+
+# Expected data URI prefix per file extension
+_MIME_PREFIX = {
+    ".jpg": "data:image/jpeg;base64,",
+    ".png": "data:image/png;base64,",
+}
+
 
 class TestSirayClient:
     """Test Siray client initialization and basic functionality."""
 
+    @pytest.mark.smoke
     def test_client_initialization_with_api_key(self):
         """Test client initialization with API key parameter."""
         client = Siray(api_key="test-api-key")
@@ -37,75 +47,144 @@ class TestSirayClient:
         client = Siray(api_key="test-api-key", timeout=60)
         assert client.timeout == 60
 
+    @pytest.mark.usefixtures("no_siray_env")
     def test_client_initialization_without_api_key_raises_error(self):
         """Test that missing API key raises ValueError."""
-        # Clear environment variable if it exists
-        old_key = os.environ.get("SIRAY_API_KEY")
-        if old_key:
-            del os.environ["SIRAY_API_KEY"]
-
         with pytest.raises(ValueError, match="API key must be provided"):
             Siray()
 
-        # Restore environment variable
-        if old_key:
-            os.environ["SIRAY_API_KEY"] = old_key
-
-    def test_client_initialization_from_environment(self):
+    def test_client_initialization_from_environment(self, siray_env_key):
         """Test client initialization from environment variable."""
-        os.environ["SIRAY_API_KEY"] = "env-test-key"
-
         client = Siray()
-        assert client.api_key == "env-test-key"
+        assert client.api_key == siray_env_key
 
-        # Cleanup
-        del os.environ["SIRAY_API_KEY"]
+    def test_client_initialization_with_connection_limits(self):
+        """Test that connection limits are forwarded to the HTTP clients."""
+        client = Siray(api_key="test-api-key", max_connections=4, max_keepalive_connections=2)
+        for base_client in (client._base_client, client._gateway_client):
+            assert base_client.max_connections == 4
+            assert base_client.max_keepalive_connections == 2
 
-    def test_client_has_namespaces(self):
-        """Test that client has image and video namespaces."""
+    def test_client_close_closes_connection_pools(self):
+        """Test that closing the client closes its pooled HTTP sessions."""
         client = Siray(api_key="test-api-key")
-        assert hasattr(client, "image")
-        assert hasattr(client, "video")
-
-
-class TestImageNamespace:
-    """Test Image namespace methods."""
-
-    def test_image_has_required_methods(self):
-        """Test that image namespace has required methods."""
+        client.close()
+        assert client._base_client.session.is_closed
+        assert client._gateway_client.session.is_closed
+
+    def test_client_context_manager_closes_connection_pools(self):
+        """Test that leaving the context closes pooled HTTP sessions."""
+        with Siray(api_key="test-api-key") as client:
+            assert not client._base_client.session.is_closed
+        assert client._base_client.session.is_closed
+
+    def test_client_closes_connection_pools_when_collected(self):
+        """Test that a dropped client releases its pooled sessions."""
         client = Siray(api_key="test-api-key")
-        assert hasattr(client.image, "generate_async")
-        assert hasattr(client.image, "query_task")
-        assert hasattr(client.image, "run")
+        session = client._base_client.session
+        del client
+        gc.collect()
+        assert session.is_closed
 
 
-class TestVideoNamespace:
-    """Test Video namespace methods."""
+class TestNamespaces:
+    """Test the image and video namespaces."""
 
-    def test_video_has_required_methods(self):
-        """Test that video namespace has required methods."""
-        client = Siray(api_key="test-api-key")
-        assert hasattr(client.video, "generate_async")
-        assert hasattr(client.video, "query_task")
-        assert hasattr(client.video, "run")
+    @pytest.mark.smoke
+    @pytest.mark.parametrize("namespace", ["image", "video"])
+    def test_namespace_contract(self, siray_client, namespace):
+        """Test that each namespace exposes the required methods."""
+        missing = _NAMESPACE_METHODS - set(dir(getattr(siray_client, namespace)))
+        assert not missing
 
 
 class TestLoadFromLocal:
     """Tests for the helper that loads local assets."""
 
-    def test_load_from_local_returns_data_uri(self, tmp_path):
-        client = Siray(api_key="test-api-key")
-        image_path = tmp_path / "sample.jpg"
-        content = b"sample-bytes"
-        image_path.write_bytes(content)
-
-        result = client.load_from_local(str(image_path))
-
-        assert result.startswith("data:image/jpeg;base64,")
-        _, encoded = result.split(",", 1)
-        assert encoded == base64.b64encode(content).decode("ascii")
-
-    def test_load_from_local_missing_file(self):
-        client = Siray(api_key="test-api-key")
+    def test_load_from_local_returns_data_uri(self, siray_client, sample_jpeg):
+        content = sample_jpeg.read_bytes()
+
+        result = siray_client.load_from_local(sample_jpeg)
+
+        prefix = _MIME_PREFIX[".jpg"]
+        assert result.startswith(prefix)
+        assert result[len(prefix):] == b64encode(content).decode("ascii")
+
+    def test_load_from_local_encodes_across_chunks(self, siray_client, tmp_path, monkeypatch):
+        monkeypatch.setattr("siray.client._ENCODE_CHUNK_SIZE", 3 * 4)
+        file_path = tmp_path / "sample.bin"
+        content = bytes(range(256)) * 3 + b"tail"
+        file_path.write_bytes(content)
+
+        result = siray_client.load_from_local(file_path)
+
+        assert result == "data:application/octet-stream;base64," + b64encode(
+            content
+        ).decode("ascii")
+
+    def test_load_from_local_parallel_encoding_matches_serial(
+        self, siray_client, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr("siray.client.HAS_PYBASE64", True)
+        monkeypatch.setattr("siray.client._ENCODE_WORKERS", 3)
+        monkeypatch.setattr("siray.client._PARALLEL_ENCODE_THRESHOLD", 16)
+        monkeypatch.setattr("siray.client._ENCODE_CHUNK_SIZE", 3 * 4)
+        encoded_sizes = []
+
+        def recording_b64encode(data):
+            encoded_sizes.append(len(data))
+            return b64encode(data)
+
+        monkeypatch.setattr("siray.client.b64encode", recording_b64encode)
+        file_path = tmp_path / "sample.bin"
+        content = bytes(range(256)) * 3 + b"tail"
+        file_path.write_bytes(content)
+
+        result = siray_client.load_from_local(file_path)
+
+        assert result == "data:application/octet-stream;base64," + b64encode(
+            content
+        ).decode("ascii")
+        # Work is handed out in bounded chunks rather than one segment per worker
+        assert max(encoded_sizes) == 3 * 4
+
+    def test_load_from_local_mapped_encoding_matches_serial(
+        self, siray_client, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr("siray.client.HAS_PYBASE64", False)
+        monkeypatch.setattr("siray.client._MMAP_THRESHOLD", 16)
+        monkeypatch.setattr("siray.client._ENCODE_CHUNK_SIZE", 3 * 4)
+        file_path = tmp_path / "sample.bin"
+        content = bytes(range(256)) * 3 + b"tail"
+        file_path.write_bytes(content)
+
+        result = siray_client.load_from_local(file_path)
+
+        assert result == "data:application/octet-stream;base64," + b64encode(
+            content
+        ).decode("ascii")
+
+    def test_load_from_local_bytes_matches_string_variant(self, siray_client, tmp_path):
+        image_path = tmp_path / "sample.png"
+        image_path.write_bytes(b"png-bytes")
+
+        result = siray_client.load_from_local_bytes(image_path)
+
+        assert isinstance(result, bytearray)
+        assert result.decode("ascii") == siray_client.load_from_local(image_path)
+
+    def test_load_from_local_batch_preserves_order(self, siray_client, tmp_path):
+        paths = []
+        for index in range(5):
+            path = tmp_path / f"frame{index}.png"
+            path.write_bytes(b"frame-%d" % index)
+            paths.append(path)
+
+        assert siray_client.load_from_local_batch(paths) == [
+            siray_client.load_from_local(path) for path in paths
+        ]
+
+    def test_load_from_local_missing_file(self, siray_client):
         with pytest.raises(FileNotFoundError):
-            client.load_from_local("/non/existent/file.png")
+            siray_client.load_from_local("/non/existent/file.png")
+
@@ -9,48 +9,40 @@ from siray.exceptions import (
     APIError,
 )
 
+# (exception class, constructor kwargs, extra attributes to check)
+_CASES = [
+    (SirayError, {"status_code": 400}, {}),
+    (AuthenticationError, {"status_code": 401}, {}),
+    (
+        BadRequestError,
+        {"status_code": 400, "code": "invalid_param", "error_type": "validation_error"},
+        {"code": "invalid_param", "error_type": "validation_error"},
+    ),
+    (InternalServerError, {"status_code": 500}, {}),
+    (APIError, {"status_code": 502}, {}),
+]
+
+# Each exception is built once and shared by the checks for its case
+_INSTANCES = {cls: cls("Test error", **kwargs) for cls, kwargs, _ in _CASES}
+
+
+@pytest.fixture(scope="module", params=_CASES, ids=lambda case: case[0].__name__)
+def case(request):
+    """An exception instance with its constructor kwargs and extra attributes."""
+    cls, kwargs, extra = request.param
+    return _INSTANCES[cls], kwargs, extra
+
 
 class TestExceptions:
     """Test exception classes."""
 
-    def test_siray_error(self):
-        """Test SirayError base exception."""
-        error = SirayError("Test error", status_code=400)
+    @pytest.mark.smoke
+    def test_exception(self, case):
+        """Test message, status code, extra fields and base class."""
+        error, kwargs, extra = case
         assert str(error) == "Test error"
         assert error.message == "Test error"
-        assert error.status_code == 400
-
-    def test_authentication_error(self):
-        """Test AuthenticationError."""
-        error = AuthenticationError("Invalid API key", status_code=401)
-        assert error.message == "Invalid API key"
-        assert error.status_code == 401
-        assert isinstance(error, SirayError)
-
-    def test_bad_request_error(self):
-        """Test BadRequestError."""
-        error = BadRequestError(
-            "Invalid parameter",
-            code="invalid_param",
-            error_type="validation_error",
-            status_code=400
-        )
-        assert error.message == "Invalid parameter"
-        assert error.code == "invalid_param"
-        assert error.error_type == "validation_error"
-        assert error.status_code == 400
-        assert isinstance(error, SirayError)
-
-    def test_internal_server_error(self):
-        """Test InternalServerError."""
-        error = InternalServerError("Server error", status_code=500)
-        assert error.message == "Server error"
-        assert error.status_code == 500
-        assert isinstance(error, SirayError)
-
-    def test_api_error(self):
-        """Test APIError."""
-        error = APIError("API error", status_code=502)
-        assert error.message == "API error"
-        assert error.status_code == 502
+        assert error.status_code == kwargs["status_code"]
         assert isinstance(error, SirayError)
+        for name, value in extra.items():
+            assert getattr(error, name) == value
@@ -0,0 +1,203 @@
+"""Tests for the file upload resource."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from botocore.exceptions import ClientError
+
+from siray import Siray
+from siray.resources import file as file_module
+from siray.resources.file import AsyncFile, File, _sts_expires_at
+from siray.upload.s3_uploader import S3Uploader
+
+
+def _sts_payload(access_key_id="key-1", expiration=None):
+    credentials = {
+        "access_key_id": access_key_id,
+        "access_key_secret": "secret",
+        "security_token": "token",
+    }
+    if expiration is not None:
+        credentials["expiration"] = expiration
+    return {
+        "credentials": credentials,
+        "bucket_name": "bucket",
+        "upload_path": "/uploads",
+        "upload_endpoint": "https://upload.example.com",
+        "access_endpoint": "cdn.example.com",
+    }
+
+
+class FakeClient:
+    """Hands out queued STS payloads and counts token requests."""
+
+    def __init__(self, *payloads):
+        self.payloads = list(payloads)
+        self.requests = 0
+
+    def post(self, endpoint, data=None):
+        self.requests += 1
+        return {"data": self.payloads.pop(0)}
+
+
+class AsyncFakeClient(FakeClient):
+    """Async variant of FakeClient."""
+
+    async def post(self, endpoint, data=None):
+        return FakeClient.post(self, endpoint, data)
+
+
+@pytest.fixture
+def uploads(monkeypatch):
+    """Record uploads instead of sending them to S3."""
+    calls = []
+
+    def fake_upload_file(self, file_path, object_key, **kwargs):
+        calls.append((self, object_key))
+        return f"https://cdn.example.com/{object_key}"
+
+    monkeypatch.setattr(S3Uploader, "upload_file", fake_upload_file)
+    return calls
+
+
+class TestObjectKey:
+    """Test object key construction from the STS upload path."""
+
+    @pytest.mark.parametrize(
+        "upload_path, expected",
+        [
+            ("/uploads", "uploads/a.png"),
+            ("uploads/", "uploads/a.png"),
+            ("", "a.png"),
+            ("\\uploads\\2024", "uploads/2024/a.png"),
+        ],
+    )
+    def test_object_key(self, uploads, tmp_path, upload_path, expected):
+        file_path = tmp_path / "a.png"
+        file_path.write_bytes(b"png")
+        payload = _sts_payload(expiration=time.time() + 3600)
+        payload["upload_path"] = upload_path
+
+        File(FakeClient(payload)).upload(str(file_path))
+
+        assert uploads[0][1] == expected
+
+
+class TestStsCache:
+    """Test STS token and uploader reuse across uploads."""
+
+    def test_token_and_uploader_reused_across_uploads(self, uploads, tmp_path):
+        file_path = tmp_path / "a.png"
+        file_path.write_bytes(b"png")
+        client = FakeClient(_sts_payload(expiration=time.time() + 3600))
+        files = File(client)
+
+        assert files.upload(str(file_path)) == "https://cdn.example.com/uploads/a.png"
+        files.upload(str(file_path))
+
+        assert client.requests == 1
+        assert uploads[0][0] is uploads[1][0]
+
+    def test_expiring_token_is_refreshed(self, uploads, tmp_path):
+        file_path = tmp_path / "a.png"
+        file_path.write_bytes(b"png")
+        client = FakeClient(
+            _sts_payload("key-1", expiration=time.time() + 30),
+            _sts_payload("key-2", expiration=time.time() + 3600),
+        )
+        files = File(client)
+
+        files.upload(str(file_path))
+        files.upload(str(file_path))
+
+        assert client.requests == 2
+        assert uploads[0][0] is not uploads[1][0]
+
+    @pytest.mark.parametrize(
+        "expiration, expected",
+        [
+            ("2030-01-01T00:00:00Z", 1893456000.0),
+            ("2030-01-01T08:00:00+08:00", 1893456000.0),
+            (1893456000, 1893456000.0),
+            ("1893456000", 1893456000.0),
+            (1893456000000, 1893456000.0),
+        ],
+    )
+    def test_expiration_formats(self, expiration, expected):
+        assert _sts_expires_at(_sts_payload(expiration=expiration)) == expected
+
+    def test_missing_expiration_uses_default_lifetime(self):
+        expires_at = _sts_expires_at(_sts_payload(expiration="not-a-date"))
+        assert time.time() + 2900 < expires_at <= time.time() + 3000
+
+    def test_rejected_credentials_are_refreshed_and_retried(self, monkeypatch, tmp_path):
+        file_path = tmp_path / "a.png"
+        file_path.write_bytes(b"png")
+        uploaders = []
+
+        def fake_upload_file(self, file_path, object_key, **kwargs):
+            uploaders.append(self)
+            if len(uploaders) == 1:
+                raise ClientError({"Error": {"Code": "ExpiredToken"}}, "PutObject")
+            return f"https://cdn.example.com/{object_key}"
+
+        monkeypatch.setattr(S3Uploader, "upload_file", fake_upload_file)
+        client = FakeClient(
+            _sts_payload("key-1", expiration=time.time() + 3600),
+            _sts_payload("key-2", expiration=time.time() + 3600),
+        )
+
+        url = File(client).upload(str(file_path))
+
+        assert url == "https://cdn.example.com/uploads/a.png"
+        assert client.requests == 2
+        assert uploaders[0] is not uploaders[1]
+
+    def test_other_errors_keep_cached_token(self, monkeypatch, uploads, tmp_path):
+        file_path = tmp_path / "a.png"
+        file_path.write_bytes(b"png")
+        client = FakeClient(_sts_payload(expiration=time.time() + 3600))
+        files = File(client)
+
+        def fail(self, file_path, object_key, **kwargs):
+            raise ClientError({"Error": {"Code": "SlowDown"}}, "PutObject")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(S3Uploader, "upload_file", fail)
+            with pytest.raises(ClientError):
+                files.upload(str(file_path))
+        files.upload(str(file_path))
+
+        assert client.requests == 1
+
+    def test_verify_is_passed_to_uploader(self, tmp_path):
+        ca_bundle = str(tmp_path / "ca.pem")
+        client = Siray(api_key="test-api-key", upload_verify=ca_bundle)
+
+        uploader = client.file._get_uploader(_sts_payload())
+
+        assert uploader._client_kwargs["verify"] == ca_bundle
+        client.close()
+
+    def test_async_upload_builds_uploader_off_the_event_loop(self, monkeypatch, tmp_path):
+        file_path = tmp_path / "a.png"
+        file_path.write_bytes(b"png")
+        created_on = []
+
+        class FakeUploader:
+            def upload_file(self, file_path, object_key, **kwargs):
+                return f"https://cdn.example.com/{object_key}"
+
+        def fake_create_uploader(sts_data, verify=None):
+            created_on.append(threading.current_thread())
+            return FakeUploader()
+
+        monkeypatch.setattr(file_module, "_create_uploader", fake_create_uploader)
+        files = AsyncFile(AsyncFakeClient(_sts_payload(expiration=time.time() + 3600)))
+
+        url = asyncio.run(files.upload(str(file_path)))
+
+        assert url == "https://cdn.example.com/uploads/a.png"
+        assert created_on and created_on[0] is not threading.main_thread()
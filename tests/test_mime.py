@@ -0,0 +1,23 @@
+"""Tests for MIME type detection."""
+
+import pytest
+
+from siray._mime import _guess_content_type
+
+
+class TestContentType:
+    """Test content type detection for data URIs and uploads."""
+
+    @pytest.mark.parametrize(
+        "suffix, expected",
+        [
+            (".png", "image/png"),
+            (".jpg", "image/jpeg"),
+            (".mp4", "video/mp4"),
+            (".webp", "image/webp"),
+            (".mov", "video/quicktime"),
+            ("", None),
+        ],
+    )
+    def test_guess_content_type(self, suffix, expected):
+        assert _guess_content_type(suffix) == expected
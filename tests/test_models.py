@@ -0,0 +1,61 @@
+"""Tests for response models."""
+
+import pytest
+
+from siray.models import GenerationResponse, TaskStatus
+
+
+def _task_status(status):
+    return TaskStatus({"code": "success", "data": {"task_id": "task-1", "status": status}})
+
+
+class TestTaskStatus:
+    """Test task status classification."""
+
+    @pytest.mark.parametrize(
+        "status, completed, failed, processing",
+        [
+            ("SUCCESS", True, False, False),
+            ("success", True, False, False),
+            ("FAILURE", False, True, False),
+            ("FAILED", False, True, False),
+            ("IN_PROGRESS", False, False, True),
+            ("queued", False, False, True),
+            ("S", False, False, False),
+            ("UCC", False, False, False),
+            ("FAIL", False, False, False),
+            ("UNKNOWN", False, False, False),
+        ],
+    )
+    def test_status_classification(self, status, completed, failed, processing):
+        task = _task_status(status)
+        assert task.is_completed() is completed
+        assert task.is_failed() is failed
+        assert task.is_processing() is processing
+
+    def test_repr_and_equality(self):
+        task = _task_status("SUCCESS")
+        assert repr(task).startswith("TaskStatus(code='success', message='', task_id='task-1'")
+        assert "raw_response" not in repr(task)
+        assert task == _task_status("SUCCESS")
+        assert task != _task_status("FAILED")
+
+    def test_instances_have_no_dict(self):
+        assert not hasattr(_task_status("SUCCESS"), "__dict__")
+        assert not hasattr(GenerationResponse({"task_id": "task-1"}), "__dict__")
+
+    @pytest.mark.parametrize(
+        "progress, expected",
+        [
+            ("100%", 100),
+            ("42", 42),
+            ("", None),
+            (None, None),
+            ("n/a", None),
+            ("²%", None),
+            (50, None),
+        ],
+    )
+    def test_progress_percent(self, progress, expected):
+        task = TaskStatus({"data": {"status": "IN_PROGRESS", "progress": progress}})
+        assert task.progress_percent == expected
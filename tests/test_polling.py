@@ -0,0 +1,92 @@
+"""Tests for task polling in the image and video resources."""
+
+import asyncio
+import itertools
+
+import pytest
+
+from siray.resources import AsyncImage, AsyncVideo, Image, Video
+from siray.resources._polling import _poll_delays
+
+
+def _task(status):
+    return {"data": {"task_id": "task-1", "status": status}}
+
+
+class FakeClient:
+    """Reports a task as processing for the first five polls."""
+
+    def __init__(self):
+        self.polls = 0
+
+    def post(self, endpoint, data=None):
+        return {"task_id": "task-1"}
+
+    def get(self, endpoint, params=None):
+        self.polls += 1
+        return _task("SUCCESS" if self.polls > 5 else "IN_PROGRESS")
+
+
+class AsyncFakeClient(FakeClient):
+    """Async variant of FakeClient."""
+
+    async def post(self, endpoint, data=None):
+        return FakeClient.post(self, endpoint, data)
+
+    async def get(self, endpoint, params=None):
+        return FakeClient.get(self, endpoint, params)
+
+
+@pytest.fixture
+def no_jitter(monkeypatch):
+    """Make the poll delays deterministic."""
+    monkeypatch.setattr("siray.resources._polling.random.uniform", lambda a, b: 0)
+
+
+class TestPollDelays:
+    """Test the backoff schedule between status checks."""
+
+    def test_delays_grow_and_are_capped(self, no_jitter):
+        delays = list(itertools.islice(_poll_delays(2.0, 5.0), 5))
+        assert delays == [2.0, 3.0, 4.5, 5.0, 5.0]
+
+    def test_delays_have_bounded_jitter(self):
+        for delay in itertools.islice(_poll_delays(2.0, 2.0), 20):
+            assert 2.0 <= delay <= 2.2
+
+    def test_poll_interval_has_a_floor(self, no_jitter):
+        assert next(_poll_delays(0, 30.0)) == 0.1
+
+
+class TestRunPolling:
+    """Test that run() waits between polls using the backoff schedule."""
+
+    @pytest.mark.parametrize("resource", [Image, Video])
+    def test_run_backs_off_between_polls(self, monkeypatch, no_jitter, resource):
+        sleeps = []
+        monkeypatch.setattr("time.sleep", sleeps.append)
+
+        status = resource(FakeClient()).run(
+            model="m", prompt="p", poll_interval=2.0, max_poll_interval=5.0
+        )
+
+        assert status.is_completed()
+        assert sleeps == [2.0, 3.0, 4.5, 5.0, 5.0]
+
+    @pytest.mark.parametrize("resource", [AsyncImage, AsyncVideo])
+    def test_async_run_backs_off_between_polls(self, monkeypatch, no_jitter, resource):
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr("asyncio.sleep", fake_sleep)
+
+        status = asyncio.run(
+            resource(AsyncFakeClient()).run(
+                model="m", prompt="p", poll_interval=2.0, max_poll_interval=5.0
+            )
+        )
+
+        assert status.is_completed()
+        assert sleeps == [2.0, 3.0, 4.5, 5.0, 5.0]
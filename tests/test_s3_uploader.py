@@ -0,0 +1,220 @@
+"""Tests for the S3 uploader."""
+
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import siray
+from siray.upload.s3_uploader import S3Uploader
+
+MIB = 1024 * 1024
+
+
+class FakeS3Client:
+    """Records S3 calls made by the uploader."""
+
+    def __init__(self):
+        self.calls = []
+        self.parts = {}
+        self._lock = threading.Lock()
+
+    def put_object(self, **kwargs):
+        assert kwargs["ContentLength"] == len(kwargs["Body"].read())
+        self.calls.append(("put_object", kwargs["Key"]))
+        return {}
+
+    def create_multipart_upload(self, **kwargs):
+        self.calls.append(("create_multipart_upload", kwargs["Key"]))
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, **kwargs):
+        with self._lock:
+            self.parts[kwargs["PartNumber"]] = kwargs["Body"].read()
+        return {"ETag": f"etag-{kwargs['PartNumber']}"}
+
+    def complete_multipart_upload(self, **kwargs):
+        self.calls.append(("complete_multipart_upload", kwargs["MultipartUpload"]))
+        return {}
+
+    def abort_multipart_upload(self, **kwargs):
+        self.calls.append(("abort_multipart_upload", kwargs["UploadId"]))
+        return {}
+
+
+@pytest.fixture
+def uploader(monkeypatch):
+    monkeypatch.setattr(S3Uploader, "MIN_CHUNK_SIZE", 1)
+    uploader = S3Uploader(
+        access_key_id="key",
+        secret_access_key="secret",
+        session_token="token",
+        region="cn-bj",
+        bucket_name="bucket",
+        endpoint_url="https://upload.example.com",
+        access_endpoint="cdn.example.com",
+        multipart_threshold=8,
+        chunk_size=4,
+    )
+    uploader.s3_client = uploader._abort_client = FakeS3Client()
+    return uploader
+
+
+class TestS3Uploader:
+    """Test upload strategy selection and multipart uploads."""
+
+    def test_small_file_uses_simple_upload(self, uploader, tmp_path):
+        file_path = tmp_path / "small.txt"
+        file_path.write_bytes(b"tiny")
+
+        url = uploader.upload_file(str(file_path), "uploads/small.txt")
+
+        assert url == "https://cdn.example.com/uploads/small.txt"
+        assert uploader.s3_client.calls == [("put_object", "uploads/small.txt")]
+
+    def test_large_file_uploads_parts_in_order(self, uploader, tmp_path):
+        content = b"0123456789abcdefghij-"
+        file_path = tmp_path / "large.bin"
+        file_path.write_bytes(content)
+
+        uploader.upload_file(str(file_path), "uploads/large.bin")
+
+        s3 = uploader.s3_client
+        assert b"".join(s3.parts[n] for n in sorted(s3.parts)) == content
+        assert s3.calls[-1] == (
+            "complete_multipart_upload",
+            {"Parts": [{"PartNumber": n, "ETag": f"etag-{n}"} for n in range(1, 7)]},
+        )
+
+    def test_multipart_threshold_per_call(self, uploader, tmp_path):
+        file_path = tmp_path / "medium.bin"
+        file_path.write_bytes(b"0123456789")
+
+        uploader.upload_file(str(file_path), "uploads/medium.bin", multipart_threshold=16)
+
+        assert uploader.s3_client.calls == [("put_object", "uploads/medium.bin")]
+
+    def test_zero_multipart_threshold_always_uses_multipart(self, uploader, tmp_path):
+        file_path = tmp_path / "small.txt"
+        file_path.write_bytes(b"tiny")
+
+        uploader.upload_file(str(file_path), "uploads/small.txt", multipart_threshold=0)
+
+        assert uploader.s3_client.calls[0] == ("create_multipart_upload", "uploads/small.txt")
+
+    def test_chunk_size_overrides_default(self, uploader, tmp_path):
+        file_path = tmp_path / "large.bin"
+        file_path.write_bytes(b"x" * 20)
+
+        uploader.upload_file(str(file_path), "uploads/large.bin", chunk_size=10)
+
+        assert sorted(uploader.s3_client.parts) == [1, 2]
+
+    def test_progress_callback_reports_each_part(self, uploader, tmp_path):
+        file_path = tmp_path / "large.bin"
+        file_path.write_bytes(b"x" * 10)
+        progress = []
+
+        uploader.upload_file(
+            str(file_path),
+            "uploads/large.bin",
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        assert len(progress) == 3
+        assert progress[-1] == (10, 10)
+
+    @pytest.mark.parametrize(
+        "file_size,expected_mib",
+        [
+            (100 * MIB, 32),
+            (10 * 1024 * MIB, 160),
+            (100 * 1024 * MIB, 256),
+            (5 * 1024 * 1024 * MIB, 525),
+        ],
+    )
+    def test_auto_chunk_size_scales_with_file_size(self, uploader, file_size, expected_mib):
+        assert uploader._auto_chunk_size(file_size) == expected_mib * MIB
+
+    def test_chunk_size_below_s3_minimum_is_rejected(self, uploader, tmp_path, monkeypatch):
+        monkeypatch.setattr(S3Uploader, "MIN_CHUNK_SIZE", 5)
+        file_path = tmp_path / "large.bin"
+        file_path.write_bytes(b"x" * 20)
+
+        with pytest.raises(ValueError, match="chunk_size must be at least 5 bytes"):
+            uploader.upload_file(str(file_path), "uploads/large.bin", chunk_size=4)
+
+    def test_failed_part_aborts_upload(self, uploader, tmp_path):
+        file_path = tmp_path / "large.bin"
+        file_path.write_bytes(b"x" * 40)
+        attempted = []
+
+        def fail(**kwargs):
+            attempted.append(kwargs["PartNumber"])
+            if kwargs["PartNumber"] > 1:
+                time.sleep(0.05)
+            raise RuntimeError("part failed")
+
+        uploader.s3_client.upload_part = fail
+        uploader.max_concurrency = 1
+
+        with pytest.raises(RuntimeError, match="part failed"):
+            uploader.upload_file(str(file_path), "uploads/large.bin")
+
+        assert uploader.s3_client.calls[-1] == ("abort_multipart_upload", "upload-1")
+        # Queued parts are cancelled once one part fails
+        assert len(attempted) < 10
+
+    def test_failing_progress_callback_aborts_upload(self, uploader, tmp_path):
+        file_path = tmp_path / "large.bin"
+        file_path.write_bytes(b"x" * 400)
+        uploader.max_concurrency = 1
+
+        def fail(done, total):
+            raise RuntimeError("callback failed")
+
+        with pytest.raises(RuntimeError, match="callback failed"):
+            uploader.upload_file(str(file_path), "uploads/large.bin", progress_callback=fail)
+
+        assert uploader.s3_client.calls[-1] == ("abort_multipart_upload", "upload-1")
+        # Queued parts are cancelled once the callback fails
+        assert len(uploader.s3_client.parts) < 100
+
+    def test_importing_sdk_does_not_import_boto3(self):
+        code = "import sys, siray; assert 'boto3' not in sys.modules"
+        # Run next to the package under test so the child imports the same copy
+        package_root = Path(siray.__file__).resolve().parents[1]
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=package_root)
+
+    def test_client_pool_fits_concurrent_parts(self):
+        uploader = S3Uploader(
+            access_key_id="key",
+            secret_access_key="secret",
+            session_token="token",
+            region="cn-bj",
+            bucket_name="bucket",
+            endpoint_url="https://upload.example.com",
+            max_concurrency=24,
+        )
+        config = uploader.s3_client.meta.config
+        assert config.max_pool_connections == 48
+        assert config.tcp_keepalive is True
+
+    def test_abort_failure_does_not_mask_part_error(self, uploader, tmp_path):
+        file_path = tmp_path / "large.bin"
+        file_path.write_bytes(b"x" * 40)
+
+        def fail_part(**kwargs):
+            raise RuntimeError("part failed")
+
+        def fail_abort(**kwargs):
+            raise ConnectionError("abort failed")
+
+        uploader.s3_client.upload_part = fail_part
+        uploader.s3_client.abort_multipart_upload = fail_abort
+
+        with pytest.raises(RuntimeError, match="part failed"):
+            uploader.upload_file(str(file_path), "uploads/large.bin")